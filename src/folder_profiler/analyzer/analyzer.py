@@ -32,7 +32,16 @@ class FolderAnalyzer:
 
         Returns:
             Dictionary containing all analysis results
+
+        Raises:
+            ValueError: If the tree was scanned without file stats
         """
+        if not folder_tree.has_stats:
+            raise ValueError(
+                "Folder tree was scanned with collect_stats=False; file sizes "
+                "and timestamps are placeholders and cannot be analyzed"
+            )
+
         analysis = {
             "statistics": self.stats_calculator.calculate(folder_tree),
             "duplicates": self.duplicate_detector.find_duplicates(folder_tree),
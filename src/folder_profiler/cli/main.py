@@ -2,8 +2,9 @@
 Main CLI entry point using Click.
 """
 
+from collections.abc import Sequence
 from pathlib import Path
-from typing import cast
+from typing import Optional, TextIO, cast
 
 import click
 from rich.console import Console
@@ -17,6 +18,9 @@ from folder_profiler.scanner.scanner import FolderScanner
 
 console = Console()
 
+# Formats written by --format all, in one scan/analysis pass
+_FILE_FORMATS: tuple[ReportFormat, ...] = ("json", "html")
+
 
 @click.group()
 @click.version_option(version=__version__, prog_name="folder-profiler")
@@ -37,12 +41,12 @@ def cli(ctx: click.Context) -> None:
     "--output",
     "-o",
     type=click.Path(path_type=Path),
-    help="Output report path",
+    help="Output report path (with --format all, its extension is set per format)",
 )
 @click.option(
     "--format",
     "-f",
-    type=click.Choice(["json", "html", "console"], case_sensitive=False),
+    type=click.Choice(["json", "html", "console", "all"], case_sensitive=False),
     default="console",
     help="Report format",
 )
@@ -83,68 +87,134 @@ def analyze(
 
     PATH is the folder to analyze.
     """
+    try:
+        run_analyze(
+            Path(path),
+            output=Path(output) if output else None,
+            format=format,
+            max_depth=max_depth,
+            include=include,
+            exclude=exclude,
+            no_gitignore=no_gitignore,
+        )
+
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Analysis cancelled by user[/yellow]")
+        raise click.Abort() from None
+    except Exception as e:
+        console.print(f"\n[bold red]Error:[/bold red] {e}")
+        raise click.Abort() from e
+
+
+def run_analyze(
+    path: Path,
+    output: Optional[Path] = None,
+    format: str = "console",
+    max_depth: Optional[int] = None,
+    include: Sequence[str] = (),
+    exclude: Sequence[str] = (),
+    no_gitignore: bool = False,
+    file: Optional[TextIO] = None,
+) -> list[Path]:
+    """
+    Scan, analyze and report on a folder.
+
+    This is the implementation behind the ``analyze`` command, callable
+    without going through Click's argument parsing.
+
+    Args:
+        path: Folder to analyze
+        output: Output report path (defaults to folder-report.<format>); with
+            format "all" its extension is replaced for each report
+        format: Report format (json, html, console, all)
+        max_depth: Maximum depth to scan
+        include: Include patterns
+        exclude: Exclude patterns
+        no_gitignore: Don't respect .gitignore files
+        file: Text stream to write the report to instead of a file on disk
+
+    Returns:
+        Paths of the generated reports; empty for console output or when
+        writing to ``file``
+
+    Raises:
+        ValueError: If format "all" is combined with ``file``
+    """
+    if format == "all" and file is not None:
+        raise ValueError("Format 'all' writes several reports and needs files")
+
     console.print(f"[bold blue]Analyzing:[/bold blue] {path}")
 
-    try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            # Scan the folder
-            task = progress.add_task("[cyan]Scanning folder structure...", total=None)
-            scanner = FolderScanner(
-                max_depth=max_depth,
-                include_patterns=list(include) if include else None,
-                exclude_patterns=list(exclude) if exclude else None,
-                respect_gitignore=not no_gitignore,
+    output_paths: list[Path] = []
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+    ) as progress:
+        # Scan the folder
+        task = progress.add_task("[cyan]Scanning folder structure...", total=None)
+        scanner = FolderScanner(
+            max_depth=max_depth,
+            include_patterns=list(include) if include else None,
+            exclude_patterns=list(exclude) if exclude else None,
+            respect_gitignore=not no_gitignore,
+        )
+        folder_tree = scanner.scan(path)
+        progress.update(task, completed=True)
+
+        # Analyze the folder
+        task = progress.add_task("[cyan]Analyzing files...", total=None)
+        analyzer = FolderAnalyzer()
+        analysis_results = analyzer.analyze(folder_tree)
+        progress.update(task, completed=True)
+
+        # Generate report
+        if format == "console":
+            console.print("\n")
+            reporter = ConsoleReporter(console if file is None else Console(file=file))
+            reporter.generate(analysis_results)
+        elif file is not None:
+            task = progress.add_task(
+                f"[cyan]Generating {format.upper()} report...", total=None
             )
-            folder_tree = scanner.scan(Path(path))
+            report_gen = ReportGenerator()
+            file.write(report_gen.render(analysis_results, cast(ReportFormat, format)))
             progress.update(task, completed=True)
-
-            # Analyze the folder
-            task = progress.add_task("[cyan]Analyzing files...", total=None)
-            analyzer = FolderAnalyzer()
-            analysis_results = analyzer.analyze(folder_tree)
-            progress.update(task, completed=True)
-
-            # Generate report
-            if format == "console":
-                console.print("\n")
-                reporter = ConsoleReporter(console)
-                reporter.generate(analysis_results)
+        else:
+            if format == "all":
+                formats = _FILE_FORMATS
             else:
-                output_path: Path
+                formats = (cast(ReportFormat, format),)
+
+            report_gen = ReportGenerator()
+            for report_format in formats:
                 if not output:
-                    output_path = Path(f"folder-report.{format}")
+                    output_path = Path(f"folder-report.{report_format}")
+                elif format == "all":
+                    output_path = Path(output).with_suffix(f".{report_format}")
                 else:
                     output_path = Path(output)
 
                 task = progress.add_task(
-                    f"[cyan]Generating {format.upper()} report...", total=None
+                    f"[cyan]Generating {report_format.upper()} report...", total=None
                 )
-                report_gen = ReportGenerator()
                 output_path = report_gen.generate(
-                    analysis_results, output_path, cast(ReportFormat, format)
+                    analysis_results, output_path, report_format
                 )
                 progress.update(task, completed=True)
 
                 console.print(
                     f"\n[bold green]✓[/bold green] Report generated: {output_path}"
                 )
+                output_paths.append(output_path)
 
-        # Show scan statistics
-        console.print(
-            f"\n[dim]Scanned {scanner.files_scanned:,} files, "
-            f"{scanner.folders_scanned:,} folders[/dim]"
-        )
+    # Show scan statistics
+    console.print(
+        f"\n[dim]Scanned {scanner.files_scanned:,} files, "
+        f"{scanner.folders_scanned:,} folders[/dim]"
+    )
 
-    except KeyboardInterrupt:
-        console.print("\n[yellow]Analysis cancelled by user[/yellow]")
-        raise click.Abort() from None
-    except Exception as e:
-        console.print(f"\n[bold red]Error:[/bold red] {e}")
-        raise click.Abort() from e
+    return output_paths
 
 
 @cli.command()
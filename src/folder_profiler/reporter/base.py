@@ -0,0 +1,21 @@
+"""
+Shared base for file-writing reporters.
+"""
+
+from pathlib import Path
+
+
+class BaseReporter:
+    """
+    Base class for reporters that write a report file.
+    """
+
+    @staticmethod
+    def _ensure_parent(path: Path) -> None:
+        """
+        Create the parent directory of a report path if needed.
+
+        Args:
+            path: Report output path
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
@@ -40,32 +40,22 @@ class ConsoleReporter:
             self._print_health_score(recommendations)
             self.console.print("\n")
 
-        # Print summary
+        # Each section returns early when there is nothing to show, without
+        # building any Rich tables; sections after the first print their own
+        # leading separator
         self._print_summary(stats.get("summary", {}))
-
-        # Print largest files
-        self.console.print("\n")
         self._print_largest_files(stats.get("largest_files", []))
-
-        # Print duplicates
-        self.console.print("\n")
         self._print_duplicates(duplicates)
-
-        # Print file extensions
-        self.console.print("\n")
         self._print_extensions(stats.get("extensions", {}))
-
-        # Print patterns
-        self.console.print("\n")
         self._print_patterns(patterns)
-
-        # Print recommendations
-        if recommendations and recommendations.get("recommendations"):
-            self.console.print("\n")
+        if recommendations:
             self._print_recommendations(recommendations)
 
     def _print_summary(self, summary: dict) -> None:
         """Print summary statistics."""
+        if not summary:
+            return
+
         table = Table(title="📊 Summary Statistics", show_header=False, box=None)
         table.add_column("Metric", style="cyan", width=25)
         table.add_column("Value", style="green bold")
@@ -92,6 +82,7 @@ class ConsoleReporter:
         if not files:
             return
 
+        self.console.print("\n")
         table = Table(title="📁 Top 10 Largest Files", box=None)
         table.add_column("File Name", style="cyan", no_wrap=False)
         table.add_column("Size", style="green", justify="right")
@@ -109,7 +100,11 @@ class ConsoleReporter:
     def _print_duplicates(self, duplicates: dict) -> None:
         """Print duplicates summary."""
         stats = duplicates.get("statistics", {})
+        groups = duplicates.get("duplicate_groups", [])
+        if not stats and not groups:
+            return
 
+        self.console.print("\n")
         table = Table(title="🔄 Duplicate Files", show_header=False, box=None)
         table.add_column("Metric", style="cyan", width=25)
         table.add_column("Value", style="yellow bold")
@@ -121,7 +116,6 @@ class ConsoleReporter:
         self.console.print(table)
 
         # Show top duplicate groups
-        groups = duplicates.get("duplicate_groups", [])
         if groups:
             self.console.print("\n[bold]Top Duplicate Groups:[/bold]")
             for i, group in enumerate(groups[:5], 1):
@@ -136,6 +130,7 @@ class ConsoleReporter:
         if not extensions:
             return
 
+        self.console.print("\n")
         table = Table(title="📄 File Extensions", box=None)
         table.add_column("Extension", style="cyan")
         table.add_column("Count", style="green", justify="right")
@@ -152,10 +147,14 @@ class ConsoleReporter:
 
     def _print_patterns(self, patterns: dict) -> None:
         """Print detected patterns."""
+        if not patterns:
+            return
+
         temp_files = patterns.get("temp_files", [])
         build_artifacts = patterns.get("build_artifacts", [])
         version_patterns = patterns.get("version_patterns", [])
 
+        self.console.print("\n")
         table = Table(title="🔍 Detected Patterns", show_header=False, box=None)
         table.add_column("Pattern Type", style="cyan", width=25)
         table.add_column("Count", style="yellow bold")
@@ -211,6 +210,7 @@ class ConsoleReporter:
         if not recs:
             return
 
+        self.console.print("\n")
         table = Table(title="💡 Smart Recommendations", box=None)
         table.add_column("Priority", style="bold", width=10)
         table.add_column("Title", style="cyan")
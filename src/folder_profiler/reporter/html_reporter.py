@@ -7,144 +7,158 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from folder_profiler.reporter.base import BaseReporter
 
-class HTMLReporter:
-    """
-    Generates HTML format reports.
-    """
-
-    def generate(self, analysis_results: dict[str, Any], output_path: Path) -> Path:
-        """
-        Generate HTML report.
-
-        Args:
-            analysis_results: Analysis results
-            output_path: Output file path
-
-        Returns:
-            Path to generated report
-        """
-        # Ensure parent directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Generate HTML content
-        html_content = self._generate_html(analysis_results)
-
-        # Write to file
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
-
-        return output_path
-
-    def _generate_html(self, analysis: dict[str, Any]) -> str:
-        """Generate HTML content from analysis results."""
-        stats = analysis.get("statistics", {})
-        summary = stats.get("summary", {})
-        duplicates = analysis.get("duplicates", {})
-        analysis.get("patterns", {})
-        recommendations = analysis.get("recommendations", {})
-
-        # Build recommendations section if available
-        recommendations_html = ""
-        if recommendations and recommendations.get("recommendations"):
-            recommendations_html = f"""
-    <h2>Smart Recommendations</h2>
-    {self._generate_health_score_card(recommendations)}
-    {self._generate_recommendations_table(recommendations.get('recommendations', []))}
-            """
-
-        html_template = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Folder Analysis Report</title>
-    <style>
-        body {{
+# Static stylesheet shared by every report, built once at import
+_STYLESHEET = """\
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             max-width: 1200px;
             margin: 0 auto;
             padding: 20px;
             background-color: #f5f5f5;
-        }}
-        h1 {{
+        }
+        h1 {
             color: #333;
             border-bottom: 3px solid #4CAF50;
             padding-bottom: 10px;
-        }}
-        h2 {{
+        }
+        h2 {
             color: #555;
             margin-top: 30px;
             border-bottom: 2px solid #ddd;
             padding-bottom: 5px;
-        }}
-        .summary-grid {{
+        }
+        .summary-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 15px;
             margin: 20px 0;
-        }}
-        .summary-card {{
+        }
+        .summary-card {
             background: white;
             padding: 20px;
             border-radius: 8px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .summary-card h3 {{
+        }
+        .summary-card h3 {
             margin: 0 0 10px 0;
             color: #666;
             font-size: 14px;
-        }}
-        .summary-card .value {{
+        }
+        .summary-card .value {
             font-size: 24px;
             font-weight: bold;
             color: #4CAF50;
-        }}
-        .health-score {{
+        }
+        .health-score {
             background: white;
             padding: 20px;
             border-radius: 8px;
             margin: 20px 0;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
             text-align: center;
-        }}
-        .health-score .score {{
+        }
+        .health-score .score {
             font-size: 48px;
             font-weight: bold;
             margin: 10px 0;
-        }}
-        .priority-critical {{ color: #d32f2f; font-weight: bold; }}
-        .priority-high {{ color: #f57c00; font-weight: bold; }}
-        .priority-medium {{ color: #fbc02d; font-weight: bold; }}
-        .priority-low {{ color: #1976d2; }}
-        .priority-info {{ color: #757575; }}
-        table {{
+        }
+        .priority-critical { color: #d32f2f; font-weight: bold; }
+        .priority-high { color: #f57c00; font-weight: bold; }
+        .priority-medium { color: #fbc02d; font-weight: bold; }
+        .priority-low { color: #1976d2; }
+        .priority-info { color: #757575; }
+        table {
             width: 100%;
             border-collapse: collapse;
             background: white;
             margin: 20px 0;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        th, td {{
+        }
+        th, td {
             padding: 12px;
             text-align: left;
             border-bottom: 1px solid #ddd;
-        }}
-        th {{
+        }
+        th {
             background-color: #4CAF50;
             color: white;
-        }}
-        tr:hover {{
+        }
+        tr:hover {
             background-color: #f5f5f5;
-        }}
-        .footer {{
+        }
+        .footer {
             margin-top: 40px;
             text-align: center;
             color: #999;
             font-size: 12px;
-        }}
-    </style>
+        }
+"""
+
+
+class HTMLReporter(BaseReporter):
+    """
+    Generates HTML format reports.
+    """
+
+    def generate(self, analysis_results: dict[str, Any], output_path: Path) -> Path:
+        """
+        Generate HTML report.
+
+        Args:
+            analysis_results: Analysis results
+            output_path: Output file path
+
+        Returns:
+            Path to generated report
+        """
+        self._ensure_parent(output_path)
+
+        # Write to file
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(self.render(analysis_results))
+
+        return output_path
+
+    def render(self, analysis_results: dict[str, Any]) -> str:
+        """
+        Render HTML report content without writing it to disk.
+
+        Args:
+            analysis_results: Analysis results
+
+        Returns:
+            Complete HTML document
+        """
+        return self._generate_html(analysis_results)
+
+    def _generate_html(self, analysis: dict[str, Any]) -> str:
+        """Generate HTML content from analysis results."""
+        stats = analysis.get("statistics", {})
+        summary = stats.get("summary", {})
+        duplicates = analysis.get("duplicates", {})
+        analysis.get("patterns", {})
+        recommendations = analysis.get("recommendations", {})
+
+        # Build recommendations section if available
+        recommendations_html = ""
+        if recommendations and recommendations.get("recommendations"):
+            recommendations_html = f"""
+    <h2>Smart Recommendations</h2>
+    {self._generate_health_score_card(recommendations)}
+    {self._generate_recommendations_table(recommendations.get('recommendations', []))}
+            """
+
+        html_template = f"""
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Folder Analysis Report</title>
+    <style>
+{_STYLESHEET}    </style>
 </head>
 <body>
     <h1>Folder Analysis Report</h1>
@@ -204,15 +218,15 @@ class HTMLReporter:
         if not files:
             return "<p>No files found.</p>"
 
-        rows = ""
+        rows = []
         for file in files[:10]:
-            rows += f"""
+            rows.append(f"""
         <tr>
             <td>{html.escape(file.get('name', ''))}</td>
             <td>{self._format_size(file.get('size', 0))}</td>
             <td>{html.escape(file.get('extension', ''))}</td>
         </tr>
-            """
+            """)
 
         return f"""
         <table>
@@ -221,7 +235,7 @@ class HTMLReporter:
                 <th>Size</th>
                 <th>Extension</th>
             </tr>
-            {rows}
+            {''.join(rows)}
         </table>
         """
 
@@ -251,15 +265,15 @@ class HTMLReporter:
         if not extensions:
             return "<p>No extensions found.</p>"
 
-        rows = ""
+        rows = []
         for ext, data in list(extensions.items())[:15]:
-            rows += f"""
+            rows.append(f"""
         <tr>
             <td>{html.escape(ext)}</td>
             <td>{data.get('count', 0):,}</td>
             <td>{self._format_size(data.get('total_size', 0))}</td>
         </tr>
-            """
+            """)
 
         return f"""
         <table>
@@ -268,7 +282,7 @@ class HTMLReporter:
                 <th>Count</th>
                 <th>Total Size</th>
             </tr>
-            {rows}
+            {''.join(rows)}
         </table>
         """
 
@@ -302,7 +316,7 @@ class HTMLReporter:
         if not recommendations:
             return "<p>No recommendations available.</p>"
 
-        rows = ""
+        rows = []
         for rec in recommendations[:10]:  # Top 10
             priority = rec.get("priority", "info")
             priority_class = f"priority-{priority}"
@@ -310,14 +324,14 @@ class HTMLReporter:
             savings = rec.get("estimated_savings", 0)
             impact = self._format_size(savings) if savings > 0 else "-"
 
-            rows += f"""
+            rows.append(f"""
         <tr>
             <td class="{priority_class}">{priority.upper()}</td>
             <td>{html.escape(rec.get('title', ''))}</td>
             <td>{html.escape(rec.get('action', ''))}</td>
             <td>{impact}</td>
         </tr>
-            """
+            """)
 
         return f"""
         <table>
@@ -327,6 +341,6 @@ class HTMLReporter:
                 <th>Action</th>
                 <th>Estimated Savings</th>
             </tr>
-            {rows}
+            {''.join(rows)}
         </table>
         """
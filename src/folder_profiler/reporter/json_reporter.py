@@ -2,13 +2,24 @@
 JSON report generation.
 """
 
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import orjson
 
-class JSONReporter:
+from folder_profiler import __version__
+from folder_profiler.reporter.base import BaseReporter
+
+# Report metadata that is fixed for the process; only generated_at varies
+_GENERATOR = "folder-profiler"
+_VERSION = __version__
+
+# Depth analysis is keyed by int depth, which orjson only accepts when asked to
+_ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+
+class JSONReporter(BaseReporter):
     """
     Generates JSON format reports.
     """
@@ -24,21 +35,43 @@ class JSONReporter:
         Returns:
             Path to generated report
         """
+        self._ensure_parent(output_path)
+
+        with open(output_path, "wb") as f:
+            f.write(self.dumps(analysis_results))
+
+        return output_path
+
+    def render(self, analysis_results: dict[str, Any]) -> str:
+        """
+        Render JSON report content without writing it to disk.
+
+        Args:
+            analysis_results: Analysis results
+
+        Returns:
+            Pretty-printed JSON document
+        """
+        return self.dumps(analysis_results).decode("utf-8")
+
+    def dumps(self, analysis_results: dict[str, Any]) -> bytes:
+        """
+        Serialize the JSON report to UTF-8 bytes.
+
+        Args:
+            analysis_results: Analysis results
+
+        Returns:
+            Encoded report document, as written by ``generate()``
+        """
         # Add metadata
         report = {
             "metadata": {
                 "generated_at": datetime.now().isoformat(),
-                "generator": "folder-profiler",
-                "version": "0.1.0",
+                "generator": _GENERATOR,
+                "version": _VERSION,
             },
             "analysis": analysis_results,
         }
 
-        # Ensure parent directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write JSON with pretty printing
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
-
-        return output_path
+        return orjson.dumps(report, option=_ORJSON_OPTIONS)
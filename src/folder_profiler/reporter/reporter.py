@@ -49,3 +49,30 @@ class ReportGenerator:
             raise NotImplementedError("PDF format not yet supported")
         else:
             raise ValueError(f"Unsupported format: {format}")
+
+    def render(
+        self,
+        analysis_results: dict[str, Any],
+        format: ReportFormat = "html",
+    ) -> str:
+        """
+        Render a report in the specified format as a string.
+
+        Args:
+            analysis_results: Analysis results to report
+            format: Report format (json, html, pdf)
+
+        Returns:
+            Report content
+
+        Raises:
+            ValueError: If format is unsupported
+        """
+        if format == "json":
+            return self.json_reporter.render(analysis_results)
+        elif format == "html":
+            return self.html_reporter.render(analysis_results)
+        elif format == "pdf":
+            raise NotImplementedError("PDF format not yet supported")
+        else:
+            raise ValueError(f"Unsupported format: {format}")
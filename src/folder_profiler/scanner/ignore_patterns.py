@@ -2,8 +2,15 @@
 Ignore pattern handling (.gitignore-style patterns).
 """
 
-import fnmatch
+import os
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional, Union
+
+import pathspec
+
+# Windows paths are case-insensitive; fold patterns and paths the same way
+_FOLD_CASE = os.path.normcase("A") == "a"
 
 
 class IgnorePatternMatcher:
@@ -16,34 +23,53 @@ class IgnorePatternMatcher:
         Initialize with a list of ignore patterns.
 
         Args:
-            patterns: List of glob-style patterns
+            patterns: List of gitignore-style patterns
         """
         self.patterns = patterns
+        self._spec: Optional[pathspec.GitIgnoreSpec] = None
 
-    def should_ignore(self, path: Path, is_dir: bool = False) -> bool:
+    def finalize(self) -> None:
+        """
+        Compile the current patterns for matching.
+
+        Patterns are compiled lazily on first use; call this again after
+        modifying ``patterns`` so the change takes effect.
+        """
+        self._spec = self._compile()
+
+    def _compile(self) -> pathspec.GitIgnoreSpec:
+        """Compile the patterns into a single gitignore matcher."""
+        patterns = self.patterns
+        if _FOLD_CASE:
+            patterns = [pattern.lower() for pattern in patterns]
+        return _compile_spec(tuple(patterns))
+
+    def should_ignore(self, path: Union[str, Path], is_dir: bool = False) -> bool:
         """
         Check if a path should be ignored.
 
+        Follows gitignore semantics: patterns without a slash match the
+        name at any depth, a trailing slash restricts a pattern to
+        directories, and later ``!`` patterns re-include earlier matches.
+
         Args:
-            path: Path to check
+            path: Path to check, as a Path or path string
             is_dir: Whether the path is a directory
 
         Returns:
             True if the path should be ignored
         """
-        path_str = str(path)
-        name = path.name
+        spec = self._spec
+        if spec is None:
+            spec = self._spec = self._compile()
 
-        for pattern in self.patterns:
-            # Directory-specific pattern
-            if pattern.endswith("/"):
-                if is_dir and fnmatch.fnmatch(name, pattern.rstrip("/")):
-                    return True
-            # General pattern
-            elif fnmatch.fnmatch(name, pattern) or fnmatch.fnmatch(path_str, pattern):
-                return True
+        path_str = str(path)
+        if _FOLD_CASE:
+            path_str = path_str.lower()
+        if is_dir:
+            path_str += "/"
 
-        return False
+        return spec.match_file(path_str)
 
     @staticmethod
     def from_file(ignore_file: Path) -> "IgnorePatternMatcher":
@@ -65,3 +91,20 @@ class IgnorePatternMatcher:
                     if line and not line.startswith("#"):
                         patterns.append(line)
         return IgnorePatternMatcher(patterns)
+
+
+@lru_cache(maxsize=32)
+def _compile_spec(patterns: tuple[str, ...]) -> pathspec.GitIgnoreSpec:
+    """
+    Compile gitignore patterns, reusing the result for repeated pattern sets.
+
+    Every scan rebuilds its matcher, usually from the same excludes and
+    ignore files, so identical pattern sets share one compiled spec.
+
+    Args:
+        patterns: Gitignore-style patterns, already case-folded if needed
+
+    Returns:
+        Compiled gitignore matcher
+    """
+    return pathspec.GitIgnoreSpec.from_lines(patterns)
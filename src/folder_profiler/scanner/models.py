@@ -3,13 +3,22 @@ Data models for file system scanning.
 """
 
 import json
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from pathlib import Path
-from typing import Any, Optional
+from pathlib import Path, PurePath
+from typing import Any, Optional, cast
 
+import orjson
 
-@dataclass
+# Scans create one model instance per file and folder, so drop the per-instance
+# __dict__ where supported (dataclass slots are available from Python 3.10)
+_DATACLASS_OPTIONS: dict[str, Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class FileInfo:
     """
     Metadata for a single file.
@@ -26,6 +35,12 @@ class FileInfo:
     is_hidden: bool = False
     is_symlink: bool = False
 
+    def __post_init__(self) -> None:
+        """Intern the low-cardinality strings shared by most files."""
+        self.extension = sys.intern(self.extension)
+        if self.mime_type is not None:
+            self.mime_type = sys.intern(self.mime_type)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
@@ -42,10 +57,13 @@ class FileInfo:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class FolderNode:
     """
     Represents a folder in the file tree.
+
+    Totals are computed on first access and cached. Call ``invalidate()`` on
+    a node and its ancestors after changing ``files`` or ``subfolders``.
     """
 
     path: Path
@@ -53,23 +71,61 @@ class FolderNode:
     depth: int
     files: list[FileInfo] = field(default_factory=list)
     subfolders: list["FolderNode"] = field(default_factory=list)
+    # False when scanned with collect_stats=False: file sizes and timestamps
+    # are placeholders, so the tree can be counted but not analyzed
+    has_stats: bool = True
+    # (total_size, total_files, total_folders), filled in on first access
+    _totals: Optional[tuple[int, int, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def total_size(self) -> int:
         """Calculate total size of all files in this folder and subfolders."""
-        file_size = sum(f.size for f in self.files)
-        subfolder_size = sum(sf.total_size for sf in self.subfolders)
-        return file_size + subfolder_size
+        return self._get_totals()[0]
 
     @property
     def total_files(self) -> int:
         """Count total files in this folder and subfolders."""
-        return len(self.files) + sum(sf.total_files for sf in self.subfolders)
+        return self._get_totals()[1]
 
     @property
     def total_folders(self) -> int:
         """Count total subfolders (including nested)."""
-        return len(self.subfolders) + sum(sf.total_folders for sf in self.subfolders)
+        return self._get_totals()[2]
+
+    def invalidate(self) -> None:
+        """Discard cached totals so they are recomputed on next access."""
+        self._totals = None
+
+    def _get_totals(self) -> tuple[int, int, int]:
+        """Compute size, file and folder totals in one pass, once."""
+        totals = self._totals
+        if totals is None:
+            # Walk with an explicit stack rather than recursing, so deep trees
+            # cannot hit the recursion limit. Nodes are listed parents-first,
+            # so the reversed list visits every child before its parent.
+            pending = []
+            stack = [self]
+            while stack:
+                node = stack.pop()
+                if node._totals is None:
+                    pending.append(node)
+                    stack.extend(node.subfolders)
+            for node in reversed(pending):
+                size = sum(f.size for f in node.files)
+                files = len(node.files)
+                folders = len(node.subfolders)
+                for subfolder in node.subfolders:
+                    sub_size, sub_files, sub_folders = cast(
+                        tuple[int, int, int], subfolder._totals
+                    )
+                    size += sub_size
+                    files += sub_files
+                    folders += sub_folders
+                node._totals = (size, files, folders)
+            totals = cast(tuple[int, int, int], self._totals)
+        return totals
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -86,4 +142,57 @@ class FolderNode:
 
     def to_json(self) -> str:
         """Serialize to JSON string."""
-        return json.dumps(self.to_dict(), indent=2)
+        try:
+            # Nodes are expanded as they are reached instead of building
+            # the to_dict() tree for the whole folder first
+            return orjson.dumps(
+                self,
+                default=_orjson_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATACLASS,
+            ).decode("utf-8")
+        except orjson.JSONEncodeError:
+            # orjson caps nesting depth; very deep trees take the slow path
+            return json.dumps(self.to_dict(), indent=2)
+
+
+def _orjson_default(obj: Any) -> Any:
+    """
+    Serialize model objects for orjson, mirroring their to_dict() output.
+
+    Args:
+        obj: Object orjson cannot serialize natively
+
+    Returns:
+        JSON-compatible replacement for the object
+
+    Raises:
+        TypeError: If the object type is not supported
+    """
+    if isinstance(obj, FolderNode):
+        return {
+            "path": str(obj.path),
+            "name": obj.name,
+            "depth": obj.depth,
+            "files": obj.files,
+            "subfolders": obj.subfolders,
+            "total_size": obj.total_size,
+            "total_files": obj.total_files,
+            "total_folders": obj.total_folders,
+        }
+    if isinstance(obj, FileInfo):
+        # orjson writes datetimes in the same format as isoformat()
+        return {
+            "path": str(obj.path),
+            "name": obj.name,
+            "size": obj.size,
+            "created": obj.created,
+            "modified": obj.modified,
+            "accessed": obj.accessed,
+            "extension": obj.extension,
+            "mime_type": obj.mime_type,
+            "is_hidden": obj.is_hidden,
+            "is_symlink": obj.is_symlink,
+        }
+    if isinstance(obj, PurePath):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
@@ -2,11 +2,16 @@
 Core folder scanning implementation.
 """
 
+import fnmatch
 import os
 import platform
+import re
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
-from pathlib import Path
-from typing import TYPE_CHECKING, Optional
+from pathlib import Path, PurePath
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 from folder_profiler.scanner.ignore_patterns import IgnorePatternMatcher
 from folder_profiler.scanner.models import FileInfo, FolderNode
@@ -19,6 +24,32 @@ else:
     except ImportError:
         magic = None  # type: ignore
 
+# Timestamps are converted three times per file; skip the attribute lookup
+_fromtimestamp = datetime.fromtimestamp
+
+# Placeholder timestamp for files listed with collect_stats=False
+_NO_TIMESTAMP = _fromtimestamp(0)
+
+# Platform is fixed for the lifetime of the process; resolve it once
+_IS_WINDOWS = platform.system() == "Windows"
+
+# Path.match() ignores case where the OS does; compiled patterns must agree
+_PATTERN_FLAGS = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+
+FILE_ATTRIBUTE_HIDDEN = 0x02
+INVALID_FILE_ATTRIBUTES = 0xFFFFFFFF
+
+# Bind GetFileAttributesW once at import instead of per file
+_GetFileAttributesW: Optional[Any] = None
+if _IS_WINDOWS:
+    import ctypes
+
+    _windll = getattr(ctypes, "windll", None)
+    if _windll is not None:
+        _GetFileAttributesW = _windll.kernel32.GetFileAttributesW
+        _GetFileAttributesW.argtypes = [ctypes.c_wchar_p]
+        _GetFileAttributesW.restype = ctypes.c_uint32
+
 
 class FolderScanner:
     """
@@ -32,6 +63,9 @@ class FolderScanner:
         exclude_patterns: Optional[list[str]] = None,
         follow_symlinks: bool = False,
         respect_gitignore: bool = True,
+        max_workers: int = 1,
+        max_errors: Optional[int] = 10_000,
+        collect_stats: bool = True,
     ):
         """
         Initialize the folder scanner.
@@ -42,20 +76,44 @@ class FolderScanner:
             exclude_patterns: Glob patterns to exclude
             follow_symlinks: Whether to follow symbolic links
             respect_gitignore: Whether to respect .gitignore files
+            max_workers: Threads used to list directories concurrently
+                (1 to scan serially, depth-first). More workers can help on
+                slow or network filesystems, but folders are then yielded in
+                completion order and pending listings are held in memory
+            max_errors: Most recent error messages to keep per scan
+                (None for unlimited)
+            collect_stats: Whether to stat files and detect MIME types. When
+                False files are only listed: sizes are 0, timestamps are the
+                Unix epoch and mime_type is None, which is much faster for
+                scans that only count or filter files. Such trees are marked
+                with ``has_stats=False`` and FolderAnalyzer rejects them
         """
         self.max_depth = max_depth
         self.include_patterns = include_patterns or []
         self.exclude_patterns = exclude_patterns or []
         self.follow_symlinks = follow_symlinks
         self.respect_gitignore = respect_gitignore
+        self.max_workers = max_workers
+        self.max_errors = max_errors
+        self.collect_stats = collect_stats
 
-        # Initialize ignore pattern matcher
-        self._ignore_matcher = IgnorePatternMatcher(self.exclude_patterns)
+        # Initialize ignore pattern matcher (rebuilt per scan in _begin_scan)
+        self._ignore_matcher = IgnorePatternMatcher(list(self.exclude_patterns))
+        self._root_prefix = ""
+        self._compile_include_patterns()
+
+        # Loop-invariant capability, checked once rather than per file
+        self._have_magic = magic is not None and collect_stats
 
         # Statistics
         self.files_scanned = 0
         self.folders_scanned = 0
-        self.errors_encountered: list[str] = []
+        self._errors: deque[str] = deque(maxlen=max_errors)
+
+    @property
+    def errors_encountered(self) -> list[str]:
+        """Error messages from the last scan, oldest first."""
+        return list(self._errors)
 
     def validate_path(self, path: Path) -> Path:
         """
@@ -109,22 +167,125 @@ class FolderScanner:
             ValueError: If path is invalid
             PermissionError: If path is not accessible
         """
+        validated_path = self._begin_scan(path)
+
+        # Scan the tree (SCAN-002, SCAN-004, SCAN-005)
+        root_node = self._scan_directory(validated_path, depth=0)
+
+        return root_node
+
+    def iter_files(self, path: Path) -> Iterator[FileInfo]:
+        """
+        Scan a folder and yield its files as they are discovered.
+
+        Unlike scan(), no folder tree is built and yielded files are not
+        retained, so with the default serial walk memory use stays flat
+        regardless of the number of files. Scan statistics are complete once the iterator is exhausted
+        or closed.
+
+        Args:
+            path: Path to scan
+
+        Returns:
+            Iterator over FileInfo objects for every scanned file
+
+        Raises:
+            ValueError: If path is invalid
+            PermissionError: If path is not accessible
+        """
+        validated_path = self._begin_scan(path)
+        root_node = self._new_root_node(validated_path, depth=0)
+
+        return (
+            item
+            for _parent, item in self._iscan(root_node)
+            if isinstance(item, FileInfo)
+        )
+
+    def _begin_scan(self, path: Path) -> Path:
+        """
+        Validate the scan root and reset per-scan state.
+
+        Args:
+            path: Path to scan
+
+        Returns:
+            Validated absolute path
+        """
         # Validate path (SCAN-001)
         validated_path = self.validate_path(path)
 
         # Reset statistics
         self.files_scanned = 0
         self.folders_scanned = 0
-        self.errors_encountered = []
+        self._errors.clear()
+
+        # Start from the configured excludes so ignore files from a previous
+        # scan root don't leak into this one
+        self._ignore_matcher = IgnorePatternMatcher(list(self.exclude_patterns))
 
         # Load .gitignore if requested
         if self.respect_gitignore:
             self._load_gitignore(validated_path)
 
-        # Scan the tree (SCAN-002, SCAN-004, SCAN-005)
-        root_node = self._scan_directory(validated_path, depth=0)
+        # The pattern set is fixed from here on; compile it once
+        self._ignore_matcher.finalize()
+        # Listed paths start with the root and a separator; strip both
+        self._root_prefix = os.path.join(validated_path, "")
+        self._compile_include_patterns()
 
-        return root_node
+        return validated_path
+
+    def _compile_include_patterns(self) -> None:
+        """
+        Compile include patterns into regexes matching like Path.match().
+
+        Relative patterns match the trailing path components, so they are
+        grouped by component count into one alternation per count. Single
+        component patterns, by far the most common, only need the name.
+        Anything else (anchored or empty patterns) falls back to Path.match().
+        """
+        by_count: dict[int, list[str]] = {}
+        self._include_fallback: list[str] = []
+        for pattern in self.include_patterns:
+            pure = PurePath(pattern)
+            if pure.anchor or not pure.parts:
+                self._include_fallback.append(pattern)
+                continue
+            by_count.setdefault(len(pure.parts), []).append(
+                fnmatch.translate("/".join(pure.parts))
+            )
+
+        compiled = {
+            count: re.compile(
+                "|".join(f"(?:{regex})" for regex in regexes), _PATTERN_FLAGS
+            )
+            for count, regexes in by_count.items()
+        }
+        self._include_name_re: Optional[re.Pattern[str]] = compiled.pop(1, None)
+        self._include_tail_res = sorted(compiled.items())
+
+    def _matches_include(self, path: Path) -> bool:
+        """
+        Check if a path matches any include pattern.
+
+        Args:
+            path: Path to check
+
+        Returns:
+            True if path matches at least one include pattern
+        """
+        name_re = self._include_name_re
+        if name_re is not None and name_re.match(path.name):
+            return True
+
+        if self._include_tail_res:
+            parts = path.parts
+            for count, tail_re in self._include_tail_res:
+                if len(parts) >= count and tail_re.match("/".join(parts[-count:])):
+                    return True
+
+        return any(path.match(pattern) for pattern in self._include_fallback)
 
     def _load_gitignore(self, root_path: Path) -> None:
         """
@@ -145,95 +306,246 @@ class FolderScanner:
             custom_matcher = IgnorePatternMatcher.from_file(custom_ignore)
             self._ignore_matcher.patterns.extend(custom_matcher.patterns)
 
-    def _scan_directory(self, dir_path: Path, depth: int) -> FolderNode:
+    def _scan_directory(self, root_path: Path, depth: int = 0) -> FolderNode:
         """
-        Recursively scan a directory and build folder tree.
+        Scan a directory tree and build folder tree.
 
         Args:
-            dir_path: Directory to scan
-            depth: Current depth in the tree
+            root_path: Directory to scan
+            depth: Depth of the root directory in the tree
 
         Returns:
-            FolderNode for this directory
+            FolderNode for the root directory
         """
-        self.folders_scanned += 1
+        root_node = self._new_root_node(root_path, depth)
+
+        for parent, item in self._iscan(root_node):
+            if isinstance(item, FileInfo):
+                parent.files.append(item)
+            else:
+                parent.subfolders.append(item)
+
+        return root_node
 
-        # Create folder node
-        node = FolderNode(
-            path=dir_path,
-            name=dir_path.name or str(dir_path),
+    def _new_root_node(self, root_path: Path, depth: int) -> FolderNode:
+        """Create the FolderNode a scan starts from."""
+        return FolderNode(
+            path=root_path,
+            name=root_path.name or str(root_path),
             depth=depth,
+            has_stats=self.collect_stats,
         )
 
+    def _iscan(
+        self, root_node: FolderNode
+    ) -> Iterator[tuple[FolderNode, Union[FileInfo, FolderNode]]]:
+        """
+        Walk a directory tree, yielding entries as they are discovered.
+
+        Directories are listed by _list_directory(), on a thread pool when
+        more than one worker is configured.
+
+        Nothing is attached to the yielded nodes; callers decide whether to
+        link each item into its parent or discard it.
+
+        Args:
+            root_node: FolderNode of the directory to walk
+
+        Yields:
+            (parent, item) pairs, where item is a FileInfo or a subfolder
+            FolderNode found directly inside parent
+        """
+        self.folders_scanned += 1
+
+        if self.max_workers > 1:
+            yield from self._iscan_parallel(root_node)
+            return
+
+        # Count in locals and publish once the walk ends or is abandoned
+        files = folders = 0
         try:
-            # Iterate through directory contents
-            for entry in dir_path.iterdir():
-                try:
-                    # Check if should be ignored
-                    if self._should_ignore(entry):
-                        continue
-
-                    # Handle symbolic links
-                    if entry.is_symlink():
-                        if not self.follow_symlinks:
-                            continue
-                        # Detect circular symlinks
-                        if self._is_circular_symlink(entry):
-                            continue
-
-                    # Process based on type
-                    if entry.is_file():
-                        file_info = self._collect_file_metadata(entry)
-                        if file_info:
-                            node.files.append(file_info)
-                            self.files_scanned += 1
-
-                    elif entry.is_dir():
-                        # Check depth limit before recursing
-                        if self.max_depth is not None and depth >= self.max_depth:
-                            # At max depth, don't recurse into subdirectories
-                            continue
-                        # Recursively scan subdirectory
-                        subfolder = self._scan_directory(entry, depth + 1)
-                        node.subfolders.append(subfolder)
-
-                except PermissionError:
-                    self.errors_encountered.append(f"Permission denied: {entry}")
-                except OSError as e:
-                    self.errors_encountered.append(f"OS error scanning {entry}: {e}")
-
-        except PermissionError:
-            self.errors_encountered.append(f"Permission denied: {dir_path}")
+            # Depth-first, visiting subfolders in listing order
+            stack = [root_node]
+            while stack:
+                node = stack.pop()
+                subfolders: list[FolderNode] = []
+                for item in self._list_directory(node):
+                    if isinstance(item, FileInfo):
+                        files += 1
+                    else:
+                        folders += 1
+                        subfolders.append(item)
+                    yield node, item
+                stack.extend(reversed(subfolders))
+        finally:
+            self.files_scanned += files
+            self.folders_scanned += folders
+
+    def _iscan_parallel(
+        self, root_node: FolderNode
+    ) -> Iterator[tuple[FolderNode, Union[FileInfo, FolderNode]]]:
+        """
+        Walk a directory tree, listing directories on a thread pool.
+
+        Each directory is listed by one worker, so every folder's entries
+        keep their listing order, but folders are yielded in the order their
+        listings complete. Counting stays on the calling thread.
+
+        Args:
+            root_node: FolderNode of the directory to walk
+
+        Yields:
+            (parent, item) pairs, as for _iscan()
+        """
+        pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        files = folders = 0
+        try:
+            pending = {pool.submit(self._list_directory, root_node): root_node}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    node = pending.pop(future)
+                    for item in future.result():
+                        if isinstance(item, FileInfo):
+                            files += 1
+                        else:
+                            folders += 1
+                            pending[pool.submit(self._list_directory, item)] = item
+                        yield node, item
+        finally:
+            # An abandoned iterator must not keep listing the rest of the tree
+            pool.shutdown(wait=True, cancel_futures=True)
+            self.files_scanned += files
+            self.folders_scanned += folders
+
+    def _list_directory(self, node: FolderNode) -> list[Union[FileInfo, FolderNode]]:
+        """
+        List one directory and build nodes for the entries that are kept.
+
+        Each directory is listed once with ``os.scandir`` and entries are
+        classified from the cached ``DirEntry`` type information, so only
+        kept files cost a ``stat`` call. Ignored, symlinked and too-deep
+        subdirectories are left out, so they are never listed at all.
+
+        Args:
+            node: FolderNode of the directory to list
+
+        Returns:
+            Subfolder FolderNodes and FileInfos found directly inside the
+            directory, in listing order
+        """
+        dir_path = node.path
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
         except OSError as e:
-            self.errors_encountered.append(f"OS error scanning {dir_path}: {e}")
+            self._record_walk_error(e)
+            return []
+
+        descend = self.max_depth is None or node.depth < self.max_depth
+        items: list[Union[FileInfo, FolderNode]] = []
+        for entry in entries:
+            name = entry.name
+            try:
+                # Type checks below are answered from the directory
+                # listing; only symlinks need the target looked up
+                is_symlink = entry.is_symlink()
+                if is_symlink and not self.follow_symlinks:
+                    continue
+                is_dir = entry.is_dir()
+
+                if is_dir and not descend:
+                    continue
+                # Excludes only need the listed path string, so no Path is
+                # built for ignored entries
+                if self._is_excluded(entry.path[len(self._root_prefix) :], is_dir):
+                    continue
+                path = dir_path / name
+                if self.include_patterns and not self._matches_include(path):
+                    continue
+                # Detect circular symlinks
+                if is_symlink and self._is_circular_symlink(path):
+                    continue
+                if not is_dir and not entry.is_file():
+                    continue
+
+            except PermissionError:
+                self._errors.append(f"Permission denied: {entry.path}")
+                continue
+            except OSError as e:
+                self._errors.append(f"OS error scanning {entry.path}: {e}")
+                continue
+
+            if is_dir:
+                items.append(
+                    FolderNode(
+                        path=path,
+                        name=name,
+                        depth=node.depth + 1,
+                        has_stats=self.collect_stats,
+                    )
+                )
+                continue
+
+            file_info = self._collect_file_metadata(path, name, entry)
+            if file_info:
+                items.append(file_info)
+
+        return items
+
+    def _record_walk_error(self, error: OSError) -> None:
+        """
+        Record a directory that could not be listed.
 
-        return node
+        Args:
+            error: Error raised while listing the directory
+        """
+        if isinstance(error, PermissionError):
+            self._errors.append(f"Permission denied: {error.filename}")
+        else:
+            self._errors.append(f"OS error scanning {error.filename}: {error}")
 
-    def _should_ignore(self, path: Path) -> bool:
+    def _is_excluded(self, relative_path: str, is_dir: bool) -> bool:
+        """
+        Check a path against the exclude and ignore-file patterns.
+
+        Paths are matched relative to the scan root, which anchors patterns
+        such as "/dist" or "docs/*.md" the way git does.
+
+        Args:
+            relative_path: Path relative to the scan root
+            is_dir: Whether the path is a directory
+
+        Returns:
+            True if the path matches an ignore pattern
+        """
+        return self._ignore_matcher.should_ignore(relative_path, is_dir)
+
+    def _should_ignore(self, path: Path, is_dir: Optional[bool] = None) -> bool:
         """
         Check if a path should be ignored based on patterns.
 
         Args:
             path: Path to check
+            is_dir: Whether the path is a directory, if already known from
+                the directory listing (looked up on disk otherwise)
 
         Returns:
             True if path should be ignored
         """
-        is_dir = path.is_dir()
-
-        # Check against ignore patterns
-        if self._ignore_matcher.should_ignore(path, is_dir):
+        if is_dir is None:
+            is_dir = path.is_dir()
+
+        # Check against ignore patterns, relative to the scan root if inside it
+        path_str = str(path)
+        if self._root_prefix and path_str.startswith(self._root_prefix):
+            path_str = path_str[len(self._root_prefix) :]
+        if self._is_excluded(path_str, is_dir):
             return True
 
         # If include patterns specified, check if path matches
-        if self.include_patterns:
-            matches_include = False
-            for pattern in self.include_patterns:
-                if path.match(pattern):
-                    matches_include = True
-                    break
-            if not matches_include:
-                return True
+        if self.include_patterns and not self._matches_include(path):
+            return True
 
         return False
 
@@ -264,83 +576,112 @@ class FolderScanner:
         except (OSError, RuntimeError):
             return True
 
-    def _collect_file_metadata(self, file_path: Path) -> Optional[FileInfo]:
+    def _collect_file_metadata(
+        self,
+        file_path: Path,
+        name: Optional[str] = None,
+        entry: Optional[os.DirEntry[str]] = None,
+    ) -> Optional[FileInfo]:
         """
         Collect metadata for a single file.
 
         Args:
             file_path: Path to file
+            name: Bare file name, if already known from the directory listing
+            entry: Directory entry for the file, whose cached stat and
+                symlink information is used instead of querying the path
 
         Returns:
             FileInfo object with metadata, or None if file cannot be accessed
         """
-        try:
-            stat = file_path.stat()
+        if name is None:
+            name = file_path.name
 
-            # Get timestamps
-            created = datetime.fromtimestamp(stat.st_ctime)
-            modified = datetime.fromtimestamp(stat.st_mtime)
-            accessed = datetime.fromtimestamp(stat.st_atime)
+        try:
+            if entry is not None:
+                is_symlink = entry.is_symlink()
+            else:
+                is_symlink = file_path.is_symlink()
+
+            if self.collect_stats:
+                stat = entry.stat() if entry is not None else file_path.stat()
+                size = stat.st_size
+
+                # Get timestamps; ctime/atime often equal mtime, so reuse that
+                # conversion (datetimes are immutable) instead of repeating it
+                mtime = stat.st_mtime
+                modified = _fromtimestamp(mtime)
+                created = (
+                    modified
+                    if stat.st_ctime == mtime
+                    else _fromtimestamp(stat.st_ctime)
+                )
+                accessed = (
+                    modified
+                    if stat.st_atime == mtime
+                    else _fromtimestamp(stat.st_atime)
+                )
+            else:
+                size = 0
+                created = modified = accessed = _NO_TIMESTAMP
 
             # Get extension
             extension = file_path.suffix.lower()
 
             # Get MIME type if magic is available
             mime_type = None
-            if magic is not None:
+            if self._have_magic:
                 try:
                     mime_type = magic.from_file(str(file_path), mime=True)
                 except Exception:
                     pass
 
             # Check if hidden
-            is_hidden = self._is_hidden(file_path)
+            is_hidden = self._is_hidden(file_path, name)
 
             # Create FileInfo
             file_info = FileInfo(
                 path=file_path,
-                name=file_path.name,
-                size=stat.st_size,
+                name=name,
+                size=size,
                 created=created,
                 modified=modified,
                 accessed=accessed,
                 extension=extension,
                 mime_type=mime_type,
                 is_hidden=is_hidden,
-                is_symlink=file_path.is_symlink(),
+                is_symlink=is_symlink,
             )
 
             return file_info
 
         except (PermissionError, OSError) as e:
-            self.errors_encountered.append(
-                f"Cannot read file metadata: {file_path} - {e}"
-            )
+            self._errors.append(f"Cannot read file metadata: {file_path} - {e}")
             return None
 
-    def _is_hidden(self, path: Path) -> bool:
+    def _is_hidden(self, path: Path, name: Optional[str] = None) -> bool:
         """
         Check if a file or directory is hidden.
 
         Args:
             path: Path to check
+            name: Bare name of the entry, if already known
 
         Returns:
             True if hidden
         """
+        if name is None:
+            name = path.name
+
         # Unix/Linux/Mac: starts with dot
-        if path.name.startswith("."):
+        if name.startswith("."):
             return True
 
         # Windows: check hidden attribute
-        if platform.system() == "Windows":
+        if _GetFileAttributesW is not None:
             try:
-                import ctypes
-
-                FILE_ATTRIBUTE_HIDDEN = 0x02
-                windll = getattr(ctypes, "windll", None)
-                if windll is not None:
-                    attrs = windll.kernel32.GetFileAttributesW(str(path))
+                attrs = _GetFileAttributesW(str(path))
+                if attrs != INVALID_FILE_ATTRIBUTES:
                     return bool(attrs & FILE_ATTRIBUTE_HIDDEN)
             except Exception:
                 pass
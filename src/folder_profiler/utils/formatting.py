@@ -5,6 +5,14 @@ Formatting utilities for display.
 from datetime import datetime
 from typing import Union
 
+_DATE_FMT = "%Y-%m-%d %H:%M:%S"
+
+# (divisor, suffix) for each unit, indexed by the size's bit length // 10
+_SIZE_UNITS = tuple(
+    (1024**power, unit)
+    for power, unit in enumerate(("B", "KB", "MB", "GB", "TB", "PB"))
+)
+
 
 def format_size(size_bytes: int) -> str:
     """
@@ -16,12 +24,12 @@ def format_size(size_bytes: int) -> str:
     Returns:
         Formatted string (e.g., "1.5 MB")
     """
-    size: float = float(size_bytes)
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if size < 1024.0:
-            return f"{size:.2f} {unit}"
-        size /= 1024.0
-    return f"{size:.2f} PB"
+    if size_bytes < 1024:
+        return f"{size_bytes:.2f} B"
+    # Every unit spans 10 bits, so the bit length picks the unit directly
+    index = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    divisor, unit = _SIZE_UNITS[index]
+    return f"{size_bytes / divisor:.2f} {unit}"
 
 
 def format_date(dt: Union[datetime, str]) -> str:
@@ -36,4 +44,4 @@ def format_date(dt: Union[datetime, str]) -> str:
     """
     if isinstance(dt, str):
         dt = datetime.fromisoformat(dt)
-    return dt.strftime("%Y-%m-%d %H:%M:%S")
+    return dt.strftime(_DATE_FMT)
@@ -2,8 +2,11 @@
 Test configuration and fixtures.
 """
 
+import hashlib
+import os
 import shutil
 import tempfile
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 
@@ -12,6 +15,27 @@ import pytest
 from folder_profiler.scanner.models import FileInfo, FolderNode
 
 
+def pytest_addoption(parser):
+    """Register command line options."""
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="Run tests marked as slow",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked as slow unless --run-slow is given."""
+    if config.getoption("--run-slow"):
+        return
+
+    skip_slow = pytest.mark.skip(reason="needs --run-slow option to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for testing."""
@@ -20,9 +44,8 @@ def temp_dir():
     shutil.rmtree(temp_path)
 
 
-@pytest.fixture
-def sample_file_info():
-    """Create a sample FileInfo object for testing."""
+def _build_sample_file_info():
+    """Build the sample FileInfo shared by the model fixtures."""
     return FileInfo(
         path=Path("/test/sample.txt"),
         name="sample.txt",
@@ -37,18 +60,91 @@ def sample_file_info():
     )
 
 
-@pytest.fixture
-def sample_folder_node(sample_file_info):
-    """Create a sample FolderNode for testing."""
+def _build_sample_folder_node(file_info):
+    """Build the sample FolderNode holding a single file."""
     return FolderNode(
         path=Path("/test"),
         name="test",
         depth=0,
-        files=[sample_file_info],
+        files=[file_info],
         subfolders=[],
     )
 
 
+@pytest.fixture
+def sample_file_info():
+    """Create a sample FileInfo object for testing."""
+    return _build_sample_file_info()
+
+
+@pytest.fixture
+def sample_folder_node(sample_file_info):
+    """Create a sample FolderNode for testing."""
+    return _build_sample_folder_node(sample_file_info)
+
+
+@pytest.fixture(scope="session")
+def sample_folder_node_dict():
+    """Serialize the sample FolderNode once; tests must not mutate the dict."""
+    return _build_sample_folder_node(_build_sample_file_info()).to_dict()
+
+
+@pytest.fixture(scope="session")
+def sample_analysis_results():
+    """Sample analysis results shared by all tests.
+
+    Reporters only read the results, so a single dict is reused; tests must
+    not mutate it.
+    """
+    return {
+        "statistics": {
+            "summary": {
+                "total_files": 10,
+                "total_folders": 3,
+                "total_size": 1024000,
+                "average_file_size": 102400,
+                "median_file_size": 51200,
+                "largest_file_size": 512000,
+            },
+            "file_types": {
+                "text/plain": {"count": 5, "total_size": 256000},
+                "application/json": {"count": 3, "total_size": 153600},
+                "image/png": {"count": 2, "total_size": 614400},
+            },
+            "extensions": {
+                ".txt": {"count": 5, "total_size": 256000},
+                ".json": {"count": 3, "total_size": 153600},
+                ".png": {"count": 2, "total_size": 614400},
+            },
+            "largest_files": [
+                {"path": "image1.png", "size": 512000, "extension": ".png"},
+                {"path": "data.json", "size": 102400, "extension": ".json"},
+            ],
+        },
+        "duplicates": {
+            "duplicate_groups": [
+                {
+                    "hash": "abc123",
+                    "size": 51200,
+                    "count": 2,
+                    "total_size": 102400,
+                    "files": ["file1.txt", "file2.txt"],
+                }
+            ],
+            "statistics": {
+                "total_duplicate_sets": 1,
+                "total_duplicate_files": 2,
+                "wasted_space": 51200,
+            },
+        },
+        "patterns": {
+            "temp_files": ["temp.tmp", "backup.bak"],
+            "build_artifacts": ["script.min.js"],
+            "version_patterns": [{"pattern": "semantic", "files": ["app-1.2.3.txt"]}],
+        },
+    }
+
+
 def make_file_info(path, name, size, extension="", mime_type=None, modified=None):
     """
     Helper function to create FileInfo objects with sensible defaults.
@@ -81,11 +177,22 @@ def make_file_info(path, name, size, extension="", mime_type=None, modified=None
     )
 
 
+@pytest.fixture(scope="session")
+def structure_cache(tmp_path_factory):
+    """Session-wide store of trees built by create_test_structure."""
+    return tmp_path_factory.mktemp("structures"), {}
+
+
 @pytest.fixture
-def create_test_structure(temp_dir):
+def create_test_structure(structure_cache):
     """
     Factory fixture to create test folder structures.
 
+    Identical structures are built once per session and the same folder
+    is returned to every test that asks for them, so callers must treat
+    it as read-only; a test that changes a shared tree fails at teardown.
+    Pass ``base_path`` to build a private tree somewhere specific.
+
     Usage:
         structure = create_test_structure({
             "file1.txt": "content1",
@@ -94,26 +201,114 @@ def create_test_structure(temp_dir):
             }
         })
     """
+    cache_root, built = structure_cache
+    used = []
 
     def _create_structure(structure, base_path=None):
         if base_path is None:
-            base_path = temp_dir
+            key = hashlib.blake2b(
+                repr(_structure_key(structure)).encode("utf-8"), digest_size=16
+            ).hexdigest()
+            used.append(key)
+            if key in built:
+                return built[key][0]
+            base_path = cache_root / key
+            _build_structure(structure, base_path)
+            built[key] = (base_path, _snapshot_tree(base_path))
+            return base_path
+
+        _build_structure(structure, base_path)
+        return base_path
+
+    yield _create_structure
+
+    for key in used:
+        path, snapshot = built[key]
+        assert _snapshot_tree(path) == snapshot, (
+            f"Test modified the shared structure at {path}; "
+            "pass base_path to build a private copy"
+        )
 
-        for name, content in structure.items():
-            path = base_path / name
 
+def _build_structure(structure, base_path):
+    """
+    Materialize a structure dict on disk.
+
+    Args:
+        structure: Nested dict of names to file contents or sub-dicts
+        base_path: Folder to build the structure in
+    """
+    # Flatten the nested dict first, then create all folders and files
+    dirs = [str(base_path)]
+    writes = []
+    pending = deque([(str(base_path), structure)])
+    while pending:
+        parent, entries = pending.popleft()
+        for name, content in entries.items():
+            path = os.path.join(parent, name)
             if isinstance(content, dict):
-                # It's a directory
-                path.mkdir(parents=True, exist_ok=True)
-                _create_structure(content, path)
+                dirs.append(path)
+                pending.append((path, content))
             else:
-                # It's a file
-                path.parent.mkdir(parents=True, exist_ok=True)
-                if isinstance(content, bytes):
-                    path.write_bytes(content)
-                else:
-                    path.write_text(str(content), encoding="utf-8")
+                if "/" in name:
+                    # File keys such as "a/b.txt" imply their folders
+                    dirs.append(os.path.dirname(path))
+                if not isinstance(content, (bytes, bytearray)):
+                    content = str(content).encode("utf-8")
+                writes.append((path, content))
+
+    # Breadth-first order lists every folder after its parent
+    for path in dirs:
+        os.makedirs(path, exist_ok=True)
+    _batch_create(writes)
+
+
+def _snapshot_tree(root):
+    """
+    Record every folder and file under root, with file sizes and mtimes.
+
+    Args:
+        root: Folder to record
+
+    Returns:
+        Sorted list of entries, comparable between calls
+    """
+    entries = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel = os.path.relpath(dirpath, root)
+        entries.extend((os.path.join(rel, name), None) for name in dirnames)
+        for name in filenames:
+            stat = os.stat(os.path.join(dirpath, name))
+            entries.append((os.path.join(rel, name), (stat.st_size, stat.st_mtime_ns)))
+    return sorted(entries)
 
-        return base_path
 
-    return _create_structure
+def _structure_key(structure):
+    """Turn a structure dict into a canonical, order-independent key."""
+    return tuple(
+        sorted(
+            (
+                name,
+                _structure_key(content) if isinstance(content, dict) else content,
+            )
+            for name, content in structure.items()
+        )
+    )
+
+
+def _batch_create(files):
+    """
+    Write a batch of files with raw os calls.
+
+    Args:
+        files: List of (path, data) tuples; parent folders must already exist
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    for path, data in files:
+        fd = os.open(path, flags, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
@@ -3,6 +3,8 @@
 from datetime import datetime
 from pathlib import Path
 
+import pytest
+
 from folder_profiler.analyzer.analyzer import FolderAnalyzer
 from folder_profiler.analyzer.duplicates import DuplicateDetector
 from folder_profiler.analyzer.patterns import PatternDetector
@@ -146,3 +148,11 @@ def test_folder_analyzer_integration():
     assert "statistics" in result
     assert "duplicates" in result
     assert "patterns" in result
+
+
+def test_folder_analyzer_rejects_tree_without_stats():
+    """Test that trees scanned with collect_stats=False are not analyzed."""
+    folder = FolderNode(path=Path("/test"), name="test", depth=0, has_stats=False)
+
+    with pytest.raises(ValueError, match="collect_stats=False"):
+        FolderAnalyzer().analyze(folder)
@@ -10,15 +10,85 @@ from folder_profiler.analyzer.recommendations import (
     RecommendationEngine,
     RecommendationType,
 )
-
-
-@pytest.fixture
+from folder_profiler.scanner.scanner import FolderScanner
+
+# Generated file lists, built once at import rather than in every test
+_TEMP_50 = tuple(f"temp{i}.tmp" for i in range(50))
+_TEMP_150 = tuple(f"temp{i}.tmp" for i in range(150))
+_PYC_200 = tuple(f"file{i}.pyc" for i in range(200))
+_BUILD_600 = tuple(f"build{i}.pyc" for i in range(600))
+_VERSIONED_10 = tuple(f"file-v{i}.txt" for i in range(10))
+_V_10 = tuple(f"v{i}" for i in range(10))
+_V_20 = tuple(f"v{i}" for i in range(20))
+_T_50 = tuple(f"t{i}" for i in range(50))
+_B_30 = tuple(f"b{i}" for i in range(30))
+
+# A tidy folder: no duplicates, temp files, build artifacts or deep nesting
+_PERFECT_ANALYSIS = {
+    "statistics": {
+        "summary": {
+            "total_files": 10,
+            "total_folders": 3,
+            "total_size": 1024 * 1024,
+            "average_file_size": 100 * 1024,
+            "median_file_size": 100 * 1024,
+            "largest_file_size": 200 * 1024,
+        },
+        "depth_analysis": {"max_depth": 3},
+        "largest_files": [],
+    },
+    "duplicates": {
+        "duplicate_groups": [],
+        "statistics": {
+            "total_duplicate_sets": 0,
+            "total_duplicate_files": 0,
+            "wasted_space": 0,
+        },
+    },
+    "patterns": {
+        "temp_files": [],
+        "build_artifacts": [],
+        "version_patterns": [],
+        "duplicate_names": {},
+    },
+}
+
+# A neglected folder that hits every health score deduction
+_POOR_ANALYSIS = {
+    "statistics": {
+        "summary": {"total_files": 100, "total_size": 10 * 1024 * 1024},
+        "depth_analysis": {"max_depth": 20},
+        "largest_files": [],
+    },
+    "duplicates": {
+        "duplicate_groups": [],
+        "statistics": {"wasted_space": 5 * 1024 * 1024},  # 50% waste
+    },
+    "patterns": {
+        "temp_files": _T_50,  # 50% temp
+        "build_artifacts": _B_30,  # 30% build
+        "version_patterns": [{"pattern": "semantic", "files": _V_20}],
+        "duplicate_names": {},
+    },
+}
+
+
+def _by_title(result):
+    """Index generated recommendations by their (unique) title."""
+    return {r["title"]: r for r in result["recommendations"]}
+
+
+@pytest.fixture(scope="session")
 def recommendation_engine():
-    """Create recommendation engine instance."""
+    """Create a recommendation engine shared by all tests.
+
+    generate_recommendations() resets the engine's state on every call, so a
+    single instance is safe to reuse.
+    """
     return RecommendationEngine()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_analysis_with_duplicates():
     """Sample analysis results with duplicates."""
     return {
@@ -53,7 +123,7 @@ def sample_analysis_with_duplicates():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_analysis_with_temp_files():
     """Sample analysis results with temp files."""
     return {
@@ -78,7 +148,7 @@ def sample_analysis_with_temp_files():
             },
         },
         "patterns": {
-            "temp_files": [f"temp{i}.tmp" for i in range(50)],  # 50 temp files
+            "temp_files": _TEMP_50,  # 50 temp files
             "build_artifacts": [],
             "version_patterns": [],
             "duplicate_names": {},
@@ -86,6 +156,22 @@ def sample_analysis_with_temp_files():
     }
 
 
+@pytest.fixture(scope="session")
+def scanned_tree(tmp_path_factory):
+    """Scan a small folder with a temp file once for all integration tests."""
+    root = tmp_path_factory.mktemp("recommendations")
+    (root / "file1.txt").write_text("content")
+    (root / "temp.tmp").write_text("temp")
+
+    return FolderScanner().scan(root)
+
+
+@pytest.fixture(scope="session")
+def analyzed_results(scanned_tree):
+    """Analyze the scanned tree once for all integration tests."""
+    return FolderAnalyzer().analyze(scanned_tree)
+
+
 class TestRecommendationEngine:
     """Tests for recommendation engine."""
 
@@ -111,41 +197,6 @@ class TestRecommendationEngine:
         assert isinstance(result["health_score"], int)
         assert isinstance(result["summary"], str)
 
-    def test_health_score_perfect(self, recommendation_engine):
-        """Test health score for perfect folder."""
-        analysis = {
-            "statistics": {
-                "summary": {
-                    "total_files": 10,
-                    "total_folders": 3,
-                    "total_size": 1024 * 1024,
-                    "average_file_size": 100 * 1024,
-                    "median_file_size": 100 * 1024,
-                    "largest_file_size": 200 * 1024,
-                },
-                "depth_analysis": {"max_depth": 3},
-                "largest_files": [],
-            },
-            "duplicates": {
-                "duplicate_groups": [],
-                "statistics": {
-                    "total_duplicate_sets": 0,
-                    "total_duplicate_files": 0,
-                    "wasted_space": 0,
-                },
-            },
-            "patterns": {
-                "temp_files": [],
-                "build_artifacts": [],
-                "version_patterns": [],
-                "duplicate_names": {},
-            },
-        }
-
-        result = recommendation_engine.generate_recommendations(analysis)
-        assert result["health_score"] >= 90
-        assert "Excellent" in result["summary"]
-
     def test_duplicate_recommendation_high_priority(
         self, recommendation_engine, sample_analysis_with_duplicates
     ):
@@ -154,16 +205,12 @@ class TestRecommendationEngine:
             sample_analysis_with_duplicates
         )
 
-        recs = result["recommendations"]
-        assert len(recs) > 0
+        recs = _by_title(result)
 
-        # Find duplicate recommendation
-        dup_rec = next(
-            (r for r in recs if r["type"] == RecommendationType.STORAGE), None
-        )
+        dup_rec = recs.get("Duplicate Files Detected")
         assert dup_rec is not None
+        assert dup_rec["type"] == RecommendationType.STORAGE
         assert dup_rec["priority"] == Priority.HIGH
-        assert "Duplicate" in dup_rec["title"]
         assert dup_rec["estimated_savings"] > 0
 
     def test_temp_files_recommendation(
@@ -174,10 +221,7 @@ class TestRecommendationEngine:
             sample_analysis_with_temp_files
         )
 
-        recs = result["recommendations"]
-
-        # Find temp files recommendation
-        temp_rec = next((r for r in recs if "Temporary" in r["title"]), None)
+        temp_rec = _by_title(result).get("Temporary Files Found")
         assert temp_rec is not None
         assert temp_rec["type"] == RecommendationType.CLEANUP
         assert temp_rec["priority"] in [Priority.HIGH, Priority.MEDIUM]
@@ -194,17 +238,14 @@ class TestRecommendationEngine:
             "duplicates": {"duplicate_groups": [], "statistics": {"wasted_space": 0}},
             "patterns": {
                 "temp_files": [],
-                "build_artifacts": [f"file{i}.pyc" for i in range(200)],
+                "build_artifacts": _PYC_200,
                 "version_patterns": [],
                 "duplicate_names": {},
             },
         }
 
         result = recommendation_engine.generate_recommendations(analysis)
-        recs = result["recommendations"]
-
-        # Find build artifacts recommendation
-        build_rec = next((r for r in recs if "Build Artifacts" in r["title"]), None)
+        build_rec = _by_title(result).get("Build Artifacts Detected")
         assert build_rec is not None
         assert build_rec["type"] == RecommendationType.CLEANUP
 
@@ -226,10 +267,7 @@ class TestRecommendationEngine:
         }
 
         result = recommendation_engine.generate_recommendations(analysis)
-        recs = result["recommendations"]
-
-        # Find deep nesting recommendation
-        depth_rec = next((r for r in recs if "Deep Folder Nesting" in r["title"]), None)
+        depth_rec = _by_title(result).get("Deep Folder Nesting")
         assert depth_rec is not None
         assert depth_rec["type"] == RecommendationType.ORGANIZATION
 
@@ -248,7 +286,7 @@ class TestRecommendationEngine:
                 "version_patterns": [
                     {
                         "pattern": "semantic",
-                        "files": [f"file-v{i}.txt" for i in range(10)],
+                        "files": _VERSIONED_10,
                     }
                 ],
                 "duplicate_names": {},
@@ -256,10 +294,7 @@ class TestRecommendationEngine:
         }
 
         result = recommendation_engine.generate_recommendations(analysis)
-        recs = result["recommendations"]
-
-        # Find version patterns recommendation
-        version_rec = next((r for r in recs if "Versioned" in r["title"]), None)
+        version_rec = _by_title(result).get("Multiple Versioned Files")
         assert version_rec is not None
         assert version_rec["type"] == RecommendationType.ORGANIZATION
 
@@ -288,11 +323,9 @@ class TestRecommendationEngine:
                 },
             },
             "patterns": {
-                "temp_files": [f"temp{i}.tmp" for i in range(150)],  # HIGH
-                "build_artifacts": [f"build{i}.pyc" for i in range(600)],  # MEDIUM
-                "version_patterns": [
-                    {"pattern": "semantic", "files": [f"v{i}" for i in range(10)]}
-                ],
+                "temp_files": _TEMP_150,  # HIGH
+                "build_artifacts": _BUILD_600,  # MEDIUM
+                "version_patterns": [{"pattern": "semantic", "files": _V_10}],
                 "duplicate_names": {},
             },
         }
@@ -301,79 +334,34 @@ class TestRecommendationEngine:
         recs = result["recommendations"]
 
         # Verify they're sorted (CRITICAL, HIGH, MEDIUM, LOW, INFO)
-        priorities = [r["priority"] for r in recs]
-        priority_weights = [
-            recommendation_engine._priority_weight(Priority(p)) for p in priorities
-        ]
+        weights = {p: recommendation_engine._priority_weight(p) for p in Priority}
+        priority_weights = [weights[Priority(r["priority"])] for r in recs]
         assert priority_weights == sorted(priority_weights)
 
-    def test_health_score_calculation(self, recommendation_engine):
+    @pytest.mark.parametrize(
+        "analysis,min_score,max_score,summary_prefix",
+        [
+            (_PERFECT_ANALYSIS, 90, 100, "Excellent"),
+            (_POOR_ANALYSIS, 0, 69, "Poor"),
+        ],
+        ids=["perfect", "poor"],
+    )
+    def test_health_score(
+        self, recommendation_engine, analysis, min_score, max_score, summary_prefix
+    ):
         """Test health score decreases with issues."""
-        perfect_analysis = {
-            "statistics": {
-                "summary": {"total_files": 10, "total_size": 1024 * 1024},
-                "depth_analysis": {"max_depth": 3},
-                "largest_files": [],
-            },
-            "duplicates": {"duplicate_groups": [], "statistics": {"wasted_space": 0}},
-            "patterns": {
-                "temp_files": [],
-                "build_artifacts": [],
-                "version_patterns": [],
-                "duplicate_names": {},
-            },
-        }
-
-        poor_analysis = {
-            "statistics": {
-                "summary": {"total_files": 100, "total_size": 10 * 1024 * 1024},
-                "depth_analysis": {"max_depth": 20},
-                "largest_files": [],
-            },
-            "duplicates": {
-                "duplicate_groups": [],
-                "statistics": {"wasted_space": 5 * 1024 * 1024},  # 50% waste
-            },
-            "patterns": {
-                "temp_files": [f"t{i}" for i in range(50)],  # 50% temp
-                "build_artifacts": [f"b{i}" for i in range(30)],  # 30% build
-                "version_patterns": [
-                    {"pattern": "semantic", "files": [f"v{i}" for i in range(20)]}
-                ],
-                "duplicate_names": {},
-            },
-        }
-
-        perfect_score = recommendation_engine.generate_recommendations(
-            perfect_analysis
-        )["health_score"]
-        poor_score = recommendation_engine.generate_recommendations(poor_analysis)[
-            "health_score"
-        ]
+        result = recommendation_engine.generate_recommendations(analysis)
 
-        assert perfect_score > poor_score
-        assert perfect_score >= 90
-        assert poor_score < 70
+        assert min_score <= result["health_score"] <= max_score
+        assert result["summary"].startswith(summary_prefix)
 
 
 class TestRecommendationsIntegration:
     """Integration tests with full analyzer."""
 
-    def test_analyzer_includes_recommendations(self, tmp_path):
+    def test_analyzer_includes_recommendations(self, analyzed_results):
         """Test that analyzer includes recommendations in results."""
-        # Create test folder structure
-        (tmp_path / "file1.txt").write_text("content")
-        (tmp_path / "temp.tmp").write_text("temp")
-
-        analyzer = FolderAnalyzer()
-        from folder_profiler.scanner.scanner import FolderScanner
-
-        scanner = FolderScanner()
-        folder_tree = scanner.scan(tmp_path)
-
-        results = analyzer.analyze(folder_tree)
-
-        assert "recommendations" in results
-        assert "health_score" in results["recommendations"]
-        assert "summary" in results["recommendations"]
-        assert "recommendations" in results["recommendations"]
+        assert "recommendations" in analyzed_results
+        assert "health_score" in analyzed_results["recommendations"]
+        assert "summary" in analyzed_results["recommendations"]
+        assert "recommendations" in analyzed_results["recommendations"]
@@ -2,36 +2,52 @@
 End-to-end CLI integration tests.
 """
 
-import json
-from pathlib import Path
+import io
 
 import pytest
 from click.testing import CliRunner
+from orjson import loads
 
-from folder_profiler.cli.main import cli
+from folder_profiler.cli.main import cli, run_analyze
 
 
-@pytest.fixture
+def fast_invoke(args):
+    """Invoke the CLI in-process, skipping CliRunner isolation and SystemExit handling.
+
+    For tests that only care that the command succeeds; any error propagates
+    as an exception instead of a non-zero exit code.
+    """
+    with cli.make_context("cli", list(args)) as ctx:
+        return cli.invoke(ctx)
+
+
+@pytest.fixture(scope="session")
 def cli_runner():
-    """Create a CLI test runner."""
+    """Create a CLI test runner shared by all tests (invoke() is stateless)."""
     return CliRunner()
 
 
-@pytest.fixture
-def test_folder(tmp_path):
-    """Create a test folder structure."""
+@pytest.fixture(scope="session")
+def test_folder(tmp_path_factory):
+    """Create a test folder structure shared by all CLI tests.
+
+    Tests only read this tree; reports are written under each test's own
+    tmp_path / "out" so outputs never land in the shared input.
+    """
+    root = tmp_path_factory.mktemp("cli_fixture")
+
     # Create some test files
-    (tmp_path / "file1.txt").write_text("Hello World")
-    (tmp_path / "file2.txt").write_text("Test content")
-    (tmp_path / "data.json").write_text('{"key": "value"}')
+    (root / "file1.txt").write_text("Hello World")
+    (root / "file2.txt").write_text("Test content")
+    (root / "data.json").write_text('{"key": "value"}')
 
     # Create subdirectory
-    subdir = tmp_path / "subdir"
+    subdir = root / "subdir"
     subdir.mkdir()
     (subdir / "nested.txt").write_text("Nested file")
     (subdir / "duplicate.txt").write_text("Hello World")  # Duplicate of file1.txt
 
-    return tmp_path
+    return root
 
 
 class TestCLIAnalyze:
@@ -45,76 +61,37 @@ class TestCLIAnalyze:
         assert "Analyzing:" in result.output
         assert "Summary Statistics" in result.output or "Scanned" in result.output
 
-    def test_analyze_with_json_output(self, cli_runner, test_folder, tmp_path):
-        """Test analyze command with JSON output."""
-        output_file = tmp_path / "output" / "report.json"
-        result = cli_runner.invoke(
-            cli,
-            [
-                "analyze",
-                str(test_folder),
-                "--format",
-                "json",
-                "--output",
-                str(output_file),
-            ],
-        )
-
-        assert result.exit_code == 0
-        assert output_file.exists()
-
-        # Verify JSON is valid
-        with open(output_file) as f:
-            data = json.load(f)
-        assert "analysis" in data
-        assert "metadata" in data
-
-    def test_analyze_with_html_output(self, cli_runner, test_folder, tmp_path):
-        """Test analyze command with HTML output."""
-        output_file = tmp_path / "output" / "report.html"
-        result = cli_runner.invoke(
-            cli,
-            [
-                "analyze",
-                str(test_folder),
-                "--format",
-                "html",
-                "--output",
-                str(output_file),
-            ],
-        )
+    def test_analyze_with_html_output(self, test_folder, tmp_path):
+        """Test analyze command with HTML output written to a file."""
+        output_file = tmp_path / "out" / "report.html"
 
-        assert result.exit_code == 0
-        assert output_file.exists()
+        fast_invoke(["analyze", str(test_folder), "-f", "html", "-o", str(output_file)])
 
-        # Verify HTML is generated
-        html_content = output_file.read_text()
-        assert "<html" in html_content or "<!DOCTYPE html>" in html_content
+        html_content = output_file.read_text(encoding="utf-8")
+        assert "<html" in html_content
+        assert "Folder Analysis Report" in html_content
 
-    def test_analyze_with_max_depth(self, cli_runner, test_folder):
-        """Test analyze command with max depth option."""
-        result = cli_runner.invoke(
-            cli, ["analyze", str(test_folder), "--max-depth", "1"]
-        )
+    def test_analyze_with_max_depth(self, test_folder, capsys):
+        """Test analyze with max depth option."""
+        run_analyze(test_folder, max_depth=1)
 
-        assert result.exit_code == 0
-        assert "Analyzing:" in result.output
+        assert "Analyzing:" in capsys.readouterr().out
 
-    def test_analyze_with_include_pattern(self, cli_runner, test_folder):
-        """Test analyze command with include patterns."""
-        result = cli_runner.invoke(
-            cli, ["analyze", str(test_folder), "--include", "*.txt"]
-        )
+    def test_analyze_with_include_pattern(self, test_folder, capsys):
+        """Test analyze with include patterns."""
+        assert run_analyze(test_folder, include=["*.txt"]) == []
 
-        assert result.exit_code == 0
+        out = capsys.readouterr().out
+        assert "file1.txt" in out
+        assert "data.json" not in out
 
-    def test_analyze_with_exclude_pattern(self, cli_runner, test_folder):
-        """Test analyze command with exclude patterns."""
-        result = cli_runner.invoke(
-            cli, ["analyze", str(test_folder), "--exclude", "*.json"]
-        )
+    def test_analyze_with_exclude_pattern(self, test_folder, capsys):
+        """Test analyze with exclude patterns."""
+        assert run_analyze(test_folder, exclude=["*.json"]) == []
 
-        assert result.exit_code == 0
+        out = capsys.readouterr().out
+        assert "nested.txt" in out
+        assert "data.json" not in out
 
     def test_analyze_nonexistent_path(self, cli_runner):
         """Test analyze command with nonexistent path."""
@@ -123,43 +100,39 @@ class TestCLIAnalyze:
         # Should fail because path doesn't exist
         assert result.exit_code != 0
 
-    def test_analyze_creates_output_directory(self, cli_runner, test_folder, tmp_path):
+    def test_analyze_creates_output_directory(self, test_folder, tmp_path):
         """Test that analyze creates output directory if it doesn't exist."""
-        output_file = tmp_path / "deep" / "nested" / "path" / "report.json"
-        result = cli_runner.invoke(
-            cli,
-            [
-                "analyze",
-                str(test_folder),
-                "--format",
-                "json",
-                "--output",
-                str(output_file),
-            ],
-        )
+        output_file = tmp_path / "out" / "deep" / "nested" / "report.json"
 
-        assert result.exit_code == 0
-        assert output_file.exists()
+        result_paths = run_analyze(test_folder, output=output_file, format="json")
 
-    def test_analyze_default_json_filename(self, cli_runner, test_folder):
-        """Test that JSON format uses default filename if not specified."""
-        with cli_runner.isolated_filesystem():
-            result = cli_runner.invoke(
-                cli, ["analyze", str(test_folder), "--format", "json"]
-            )
+        assert result_paths == [output_file]
+        assert "analysis" in loads(output_file.read_bytes())
 
-            assert result.exit_code == 0
-            assert Path("folder-report.json").exists()
+    def test_analyze_default_filename(self, test_folder, tmp_path, monkeypatch):
+        """Test that file formats use a default filename if not specified."""
+        monkeypatch.chdir(tmp_path)
 
-    def test_analyze_default_html_filename(self, cli_runner, test_folder):
-        """Test that HTML format uses default filename if not specified."""
-        with cli_runner.isolated_filesystem():
-            result = cli_runner.invoke(
-                cli, ["analyze", str(test_folder), "--format", "html"]
-            )
+        fast_invoke(["analyze", str(test_folder), "--format", "all"])
 
-            assert result.exit_code == 0
-            assert Path("folder-report.html").exists()
+        assert "analysis" in loads((tmp_path / "folder-report.json").read_bytes())
+        assert "<html" in (tmp_path / "folder-report.html").read_text(encoding="utf-8")
+
+    def test_analyze_all_formats_with_output(self, test_folder, tmp_path):
+        """Test that --format all derives each report path from --output."""
+        out_dir = tmp_path / "out"
+
+        result_paths = run_analyze(
+            test_folder, output=out_dir / "report.out", format="all"
+        )
+
+        assert result_paths == [out_dir / "report.json", out_dir / "report.html"]
+        assert all(p.exists() for p in result_paths)
+
+    def test_analyze_all_formats_rejects_stream(self, test_folder):
+        """Test that --format all cannot be written to a single stream."""
+        with pytest.raises(ValueError, match="all"):
+            run_analyze(test_folder, format="all", file=io.StringIO())
 
 
 class TestCLIConfig:
@@ -172,11 +145,11 @@ class TestCLIConfig:
         assert result.exit_code == 0
         assert "Configuration" in result.output or "Version" in result.output
 
-    def test_config_default(self, cli_runner):
+    def test_config_default(self, capsys):
         """Test config command without options."""
-        result = cli_runner.invoke(cli, ["config"])
+        fast_invoke(["config"])
 
-        assert result.exit_code == 0
+        assert "coming soon" in capsys.readouterr().out
 
 
 class TestCLIVersion:
@@ -193,84 +166,79 @@ class TestCLIVersion:
 class TestCLIIntegration:
     """End-to-end integration tests."""
 
-    def test_full_workflow_json(self, cli_runner, test_folder, tmp_path):
-        """Test full workflow: scan, analyze, and generate JSON report."""
-        output_file = tmp_path / "report.json"
-
-        result = cli_runner.invoke(
-            cli,
-            [
-                "analyze",
-                str(test_folder),
-                "--format",
+    @pytest.mark.parametrize(
+        "fmt,content_markers",
+        [
+            (
                 "json",
-                "--output",
-                str(output_file),
-                "--max-depth",
-                "10",
-            ],
-        )
-
-        assert result.exit_code == 0
-        assert output_file.exists()
-
-        # Verify the report contains expected data
-        with open(output_file) as f:
-            data = json.load(f)
-
-        assert "analysis" in data
-        assert "statistics" in data["analysis"]
-        assert "duplicates" in data["analysis"]
-        assert "patterns" in data["analysis"]
-
-        # Verify metadata
-        assert "metadata" in data
-        assert "generated_at" in data["metadata"]
-        assert data["metadata"]["generator"] == "folder-profiler"
-
-    def test_full_workflow_html(self, cli_runner, test_folder, tmp_path):
-        """Test full workflow: scan, analyze, and generate HTML report."""
-        output_file = tmp_path / "report.html"
-
-        result = cli_runner.invoke(
-            cli,
-            [
-                "analyze",
-                str(test_folder),
-                "--format",
-                "html",
-                "--output",
-                str(output_file),
-            ],
+                (
+                    '"analysis"',
+                    '"statistics"',
+                    '"duplicates"',
+                    '"patterns"',
+                    '"metadata"',
+                    '"generated_at"',
+                    '"generator": "folder-profiler"',
+                ),
+            ),
+            pytest.param(
+                "html", ("<html", "Folder Analysis Report"), marks=pytest.mark.slow
+            ),
+        ],
+    )
+    def test_full_workflow(self, test_folder, fmt, content_markers):
+        """Test full workflow: scan, analyze, and render a report."""
+        buffer = io.StringIO()
+
+        result_paths = run_analyze(test_folder, format=fmt, max_depth=10, file=buffer)
+
+        assert result_paths == []
+        content = buffer.getvalue()
+        for marker in content_markers:
+            assert marker in content
+        if fmt == "json":
+            loads(content)  # Must be valid JSON
+
+    def test_workflow_with_filters(self, test_folder):
+        """Test workflow with include/exclude patterns."""
+        buffer = io.StringIO()
+
+        run_analyze(
+            test_folder,
+            format="json",
+            include=["*.txt"],
+            exclude=["duplicate.txt"],
+            file=buffer,
         )
 
-        assert result.exit_code == 0
-        assert output_file.exists()
-
-        # Verify HTML contains expected content
-        html_content = output_file.read_text()
-        assert "Folder Analysis Report" in html_content
-        assert "<html" in html_content or "<!DOCTYPE" in html_content
+        content = buffer.getvalue()
+        assert "file1.txt" in content
+        assert "duplicate.txt" not in content
+        assert "data.json" not in content
 
-    def test_workflow_with_filters(self, cli_runner, test_folder, tmp_path):
-        """Test workflow with include/exclude patterns."""
-        output_file = tmp_path / "report.json"
+    def test_cli_passes_options_through(self, test_folder, tmp_path):
+        """Test that analyze forwards every option from the command line."""
+        output_file = tmp_path / "out" / "report.json"
 
-        result = cli_runner.invoke(
-            cli,
+        fast_invoke(
             [
                 "analyze",
                 str(test_folder),
-                "--format",
+                "-f",
                 "json",
-                "--output",
+                "-o",
                 str(output_file),
                 "--include",
                 "*.txt",
                 "--exclude",
                 "duplicate.txt",
-            ],
+                "--max-depth",
+                "10",
+            ]
         )
 
-        assert result.exit_code == 0
-        assert output_file.exists()
+        content = output_file.read_text(encoding="utf-8")
+        loads(content)  # Must be valid JSON
+        assert "file1.txt" in content
+        assert "duplicate.txt" not in content
+        assert "data.json" not in content
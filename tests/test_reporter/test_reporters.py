@@ -2,10 +2,10 @@
 Tests for report generators.
 """
 
-import json
+import re
 
 import pytest
-from bs4 import BeautifulSoup
+from orjson import loads
 from rich.console import Console
 
 from folder_profiler.reporter.console_reporter import ConsoleReporter
@@ -14,56 +14,16 @@ from folder_profiler.reporter.json_reporter import JSONReporter
 from folder_profiler.reporter.reporter import ReportGenerator
 
 
-@pytest.fixture
-def sample_analysis_results():
-    """Sample analysis results for testing."""
-    return {
-        "statistics": {
-            "summary": {
-                "total_files": 10,
-                "total_folders": 3,
-                "total_size": 1024000,
-                "average_file_size": 102400,
-                "median_file_size": 51200,
-                "largest_file_size": 512000,
-            },
-            "file_types": {
-                "text/plain": {"count": 5, "total_size": 256000},
-                "application/json": {"count": 3, "total_size": 153600},
-                "image/png": {"count": 2, "total_size": 614400},
-            },
-            "extensions": {
-                ".txt": {"count": 5, "total_size": 256000},
-                ".json": {"count": 3, "total_size": 153600},
-                ".png": {"count": 2, "total_size": 614400},
-            },
-            "largest_files": [
-                {"path": "image1.png", "size": 512000, "extension": ".png"},
-                {"path": "data.json", "size": 102400, "extension": ".json"},
-            ],
-        },
-        "duplicates": {
-            "duplicate_groups": [
-                {
-                    "hash": "abc123",
-                    "size": 51200,
-                    "count": 2,
-                    "total_size": 102400,
-                    "files": ["file1.txt", "file2.txt"],
-                }
-            ],
-            "statistics": {
-                "total_duplicate_sets": 1,
-                "total_duplicate_files": 2,
-                "wasted_space": 51200,
-            },
-        },
-        "patterns": {
-            "temp_files": ["temp.tmp", "backup.bak"],
-            "build_artifacts": ["script.min.js"],
-            "version_patterns": [{"pattern": "semantic", "files": ["app-1.2.3.txt"]}],
-        },
-    }
+@pytest.fixture(scope="class")
+def generated_json(sample_analysis_results):
+    """Serialize the sample JSON report in memory once per class and parse it."""
+    return loads(JSONReporter().dumps(sample_analysis_results))
+
+
+@pytest.fixture(scope="class")
+def generated_html(sample_analysis_results):
+    """Render the sample HTML report in memory once per class."""
+    return HTMLReporter().render(sample_analysis_results)
 
 
 class TestJSONReporter:
@@ -79,46 +39,26 @@ class TestJSONReporter:
         assert result_path.exists()
         assert result_path == output_path
 
-    def test_generate_valid_json(self, tmp_path, sample_analysis_results):
+    def test_generate_valid_json(self, generated_json):
         """Test that generated JSON is valid and parseable."""
-        reporter = JSONReporter()
-        output_path = tmp_path / "report.json"
-
-        reporter.generate(sample_analysis_results, output_path)
-
-        with open(output_path) as f:
-            data = json.load(f)
+        data = generated_json
 
         assert isinstance(data, dict)
         assert "analysis" in data
         assert "metadata" in data
 
-    def test_generate_includes_metadata(self, tmp_path, sample_analysis_results):
+    def test_generate_includes_metadata(self, generated_json):
         """Test that JSON includes metadata."""
-        reporter = JSONReporter()
-        output_path = tmp_path / "report.json"
-
-        reporter.generate(sample_analysis_results, output_path)
-
-        with open(output_path) as f:
-            data = json.load(f)
+        data = generated_json
 
         assert "generated_at" in data["metadata"]
         assert "generator" in data["metadata"]
         assert "version" in data["metadata"]
         assert data["metadata"]["generator"] == "folder-profiler"
 
-    def test_generate_includes_analysis_results(
-        self, tmp_path, sample_analysis_results
-    ):
+    def test_generate_includes_analysis_results(self, generated_json):
         """Test that JSON includes all analysis results."""
-        reporter = JSONReporter()
-        output_path = tmp_path / "report.json"
-
-        reporter.generate(sample_analysis_results, output_path)
-
-        with open(output_path) as f:
-            data = json.load(f)
+        data = generated_json
 
         assert data["analysis"]["statistics"]["summary"]["total_files"] == 10
         assert (
@@ -138,6 +78,15 @@ class TestJSONReporter:
         assert output_path.exists()
         assert output_path.parent.exists()
 
+    def test_dumps_handles_int_keys(self):
+        """Test that int-keyed sections such as depth analysis are serialized."""
+        analysis = {"statistics": {"depth_analysis": {"files_by_depth": {0: 3, 1: 2}}}}
+
+        data = loads(JSONReporter().dumps(analysis))
+
+        depth = data["analysis"]["statistics"]["depth_analysis"]
+        assert depth["files_by_depth"] == {"0": 3, "1": 2}
+
 
 class TestHTMLReporter:
     """Tests for HTML reporter."""
@@ -152,64 +101,37 @@ class TestHTMLReporter:
         assert result_path.exists()
         assert result_path == output_path
 
-    def test_generate_valid_html(self, tmp_path, sample_analysis_results):
+    def test_generate_valid_html(self, generated_html):
         """Test that generated HTML is valid."""
-        reporter = HTMLReporter()
-        output_path = tmp_path / "report.html"
-
-        reporter.generate(sample_analysis_results, output_path)
-
-        with open(output_path) as f:
-            html = f.read()
+        html = generated_html
 
-        soup = BeautifulSoup(html, "html.parser")
-        assert soup.find("html") is not None
-        assert soup.find("head") is not None
-        assert soup.find("body") is not None
+        assert "<html" in html and "</html>" in html
+        assert "<head" in html and "</head>" in html
+        assert "<body" in html and "</body>" in html
 
-    def test_generate_includes_title(self, tmp_path, sample_analysis_results):
+    def test_generate_includes_title(self, generated_html):
         """Test that HTML includes title."""
-        reporter = HTMLReporter()
-        output_path = tmp_path / "report.html"
-
-        reporter.generate(sample_analysis_results, output_path)
-
-        with open(output_path) as f:
-            html = f.read()
+        html = generated_html
 
-        soup = BeautifulSoup(html, "html.parser")
-        title = soup.find("title")
+        title = re.search(r"<title>([^<]+)</title>", html)
         assert title is not None
-        assert "Folder Analysis Report" in title.text
+        assert "Folder Analysis Report" in title.group(1)
 
-    def test_generate_includes_statistics(self, tmp_path, sample_analysis_results):
+    def test_generate_includes_statistics(self, generated_html):
         """Test that HTML includes statistics."""
-        reporter = HTMLReporter()
-        output_path = tmp_path / "report.html"
-
-        reporter.generate(sample_analysis_results, output_path)
-
-        with open(output_path) as f:
-            html = f.read()
+        html = generated_html
 
         assert "10" in html  # total files
         assert "3" in html  # total folders
 
-    def test_generate_includes_css(self, tmp_path, sample_analysis_results):
+    def test_generate_includes_css(self, generated_html):
         """Test that HTML includes CSS styling."""
-        reporter = HTMLReporter()
-        output_path = tmp_path / "report.html"
-
-        reporter.generate(sample_analysis_results, output_path)
+        html = generated_html
 
-        with open(output_path) as f:
-            html = f.read()
-
-        soup = BeautifulSoup(html, "html.parser")
-        style = soup.find("style")
+        style = re.search(r"<style>(.*?)</style>", html, re.DOTALL)
         assert style is not None
-        assert "body" in style.text
-        assert "summary-grid" in style.text
+        assert "body" in style.group(1)
+        assert "summary-grid" in style.group(1)
 
     def test_generate_creates_parent_directories(
         self, tmp_path, sample_analysis_results
@@ -260,6 +182,14 @@ class TestConsoleReporter:
         # Should not crash
         reporter.generate(empty_results)
 
+    def test_generate_skips_empty_sections(self, capsys):
+        """Test that sections without data print nothing at all."""
+        reporter = ConsoleReporter(Console(force_terminal=False))
+
+        reporter.generate({"statistics": {"summary": {}}, "duplicates": {}})
+
+        assert capsys.readouterr().out == ""
+
 
 class TestReportGenerator:
     """Tests for main report generator."""
@@ -272,8 +202,7 @@ class TestReportGenerator:
         result_path = generator.generate(sample_analysis_results, output_path, "json")
 
         assert result_path.exists()
-        with open(result_path) as f:
-            data = json.load(f)
+        data = loads(result_path.read_bytes())
         assert "analysis" in data
 
     def test_generate_html_report(self, tmp_path, sample_analysis_results):
@@ -284,8 +213,7 @@ class TestReportGenerator:
         result_path = generator.generate(sample_analysis_results, output_path, "html")
 
         assert result_path.exists()
-        with open(result_path) as f:
-            html = f.read()
+        html = result_path.read_text(encoding="utf-8")
         assert "<!DOCTYPE html>" in html or "<html" in html
 
     def test_generate_unsupported_format(self, tmp_path, sample_analysis_results):
@@ -303,3 +231,21 @@ class TestReportGenerator:
 
         with pytest.raises(NotImplementedError):
             generator.generate(sample_analysis_results, output_path, "pdf")
+
+    @pytest.mark.parametrize("fmt", ["json", "html"])
+    def test_render_matches_generated_file(
+        self, tmp_path, sample_analysis_results, fmt
+    ):
+        """Test that render() returns the same document generate() writes."""
+        generator = ReportGenerator()
+        output_path = tmp_path / f"report.{fmt}"
+
+        generator.generate(sample_analysis_results, output_path, fmt)
+        rendered = generator.render(sample_analysis_results, fmt)
+
+        written = output_path.read_text(encoding="utf-8")
+        if fmt == "json":
+            # generated_at differs between the two calls
+            assert loads(rendered)["analysis"] == loads(written)["analysis"]
+        else:
+            assert rendered.split("Generated:")[0] == written.split("Generated:")[0]
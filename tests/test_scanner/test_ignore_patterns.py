@@ -34,12 +34,38 @@ class TestIgnorePatternMatcher:
         assert matcher.should_ignore(Path("test_data.json"))
         assert not matcher.should_ignore(Path("file_test.txt"))
 
+    def test_negation_pattern_reincludes(self):
+        """Test that a later ! pattern re-includes an ignored file."""
+        matcher = IgnorePatternMatcher(["*.log", "!keep.log"])
+
+        assert matcher.should_ignore(Path("debug.log"))
+        assert not matcher.should_ignore(Path("keep.log"))
+
+    def test_pattern_matches_nested_paths(self):
+        """Test that slash-free patterns match at any depth."""
+        matcher = IgnorePatternMatcher(["build", "*.pyc"])
+
+        assert matcher.should_ignore(Path("project/build"), is_dir=True)
+        assert matcher.should_ignore(Path("project/src/module.pyc"))
+        assert not matcher.should_ignore(Path("project/src/module.py"))
+
     def test_empty_patterns(self):
         """Test with no patterns."""
         matcher = IgnorePatternMatcher([])
 
         assert not matcher.should_ignore(Path("anything.txt"))
 
+    def test_finalize_applies_modified_patterns(self):
+        """Test that finalize picks up patterns added after first use."""
+        matcher = IgnorePatternMatcher(["*.pyc"])
+        assert not matcher.should_ignore(Path("debug.log"))
+
+        matcher.patterns.append("*.log")
+        matcher.finalize()
+
+        assert matcher.should_ignore(Path("debug.log"))
+        assert matcher.should_ignore(Path("test.pyc"))
+
     def test_from_file_nonexistent(self, temp_dir):
         """Test loading from non-existent file."""
         matcher = IgnorePatternMatcher.from_file(temp_dir / ".gitignore")
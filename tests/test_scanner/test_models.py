@@ -3,9 +3,12 @@ Unit tests for scanner models.
 """
 
 import json
+import sys
 from datetime import datetime
 from pathlib import Path
 
+import pytest
+
 from folder_profiler.scanner.models import FileInfo, FolderNode
 
 
@@ -42,6 +45,29 @@ class TestFileInfo:
         assert "modified" in data
         assert "accessed" in data
 
+    def test_file_info_interns_extension_and_mime_type(self, sample_file_info):
+        """Test that equal extensions and MIME types share one string object."""
+        other = FileInfo(
+            path=Path("/test/other.txt"),
+            name="other.txt",
+            size=1,
+            created=sample_file_info.created,
+            modified=sample_file_info.modified,
+            accessed=sample_file_info.accessed,
+            extension="".join([".t", "xt"]),
+            mime_type="/".join(["text", "plain"]),
+        )
+
+        assert other.extension is sample_file_info.extension
+        assert other.mime_type is sample_file_info.mime_type
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 10), reason="dataclass slots require Python 3.10+"
+    )
+    def test_file_info_uses_slots(self, sample_file_info):
+        """Test that FileInfo instances carry no per-instance __dict__."""
+        assert not hasattr(sample_file_info, "__dict__")
+
 
 class TestFolderNode:
     """Test FolderNode model."""
@@ -132,9 +158,29 @@ class TestFolderNode:
 
         assert parent.total_folders == 2
 
-    def test_folder_node_to_dict(self, sample_folder_node):
+    @pytest.mark.skipif(
+        sys.version_info < (3, 10), reason="dataclass slots require Python 3.10+"
+    )
+    def test_folder_node_uses_slots(self, sample_folder_node):
+        """Test that FolderNode instances carry no per-instance __dict__."""
+        assert not hasattr(sample_folder_node, "__dict__")
+        assert sample_folder_node.total_size == 1024  # Cache lives in a slot
+
+    def test_folder_node_invalidate_recomputes_totals(self, sample_file_info):
+        """Test that totals are cached until invalidate() is called."""
+        node = FolderNode(path=Path("/test"), name="test", depth=0)
+        assert node.total_files == 0
+
+        node.files.append(sample_file_info)
+        assert node.total_files == 0  # Cached
+
+        node.invalidate()
+        assert node.total_files == 1
+        assert node.total_size == 1024
+
+    def test_folder_node_to_dict(self, sample_folder_node_dict):
         """Test FolderNode dictionary serialization."""
-        data = sample_folder_node.to_dict()
+        data = sample_folder_node_dict
 
         assert data["name"] == "test"
         assert data["depth"] == 0
@@ -143,10 +189,49 @@ class TestFolderNode:
         assert data["total_files"] == 1
         assert data["total_folders"] == 0
 
-    def test_folder_node_to_json(self, sample_folder_node):
+    def test_folder_node_to_json(self, sample_folder_node, sample_folder_node_dict):
         """Test FolderNode JSON serialization."""
         json_str = sample_folder_node.to_json()
         data = json.loads(json_str)
 
         assert data["name"] == "test"
         assert isinstance(json_str, str)
+        assert data == sample_folder_node_dict
+
+    def test_folder_node_totals_deeper_than_recursion_limit(self):
+        """Test that totals are computed without recursing per level."""
+        levels = sys.getrecursionlimit() + 100
+        root = node = FolderNode(path=Path("/test"), name="test", depth=0)
+        for depth in range(1, levels + 1):
+            child = FolderNode(path=node.path / "d", name="d", depth=depth)
+            node.subfolders.append(child)
+            node = child
+        now = datetime.now()
+        node.files.append(
+            FileInfo(
+                path=node.path / "leaf.txt",
+                name="leaf.txt",
+                size=7,
+                created=now,
+                modified=now,
+                accessed=now,
+                extension=".txt",
+            )
+        )
+
+        assert root.total_folders == levels
+        assert root.total_files == 1
+        assert root.total_size == 7
+        assert root.subfolders[0].total_folders == levels - 1
+
+    def test_folder_node_to_json_deep_tree(self):
+        """Test that trees deeper than orjson's nesting limit still serialize."""
+        root = node = FolderNode(path=Path("/test"), name="test", depth=0)
+        for depth in range(1, 201):
+            child = FolderNode(path=node.path / "d", name="d", depth=depth)
+            node.subfolders.append(child)
+            node = child
+
+        data = json.loads(root.to_json())
+
+        assert data["total_folders"] == 200
@@ -2,6 +2,7 @@
 Unit tests for FolderScanner.
 """
 
+import os
 from datetime import datetime
 from pathlib import Path
 
@@ -23,6 +24,7 @@ class TestFolderScanner:
         assert scanner.exclude_patterns == []
         assert scanner.follow_symlinks is False
         assert scanner.respect_gitignore is True
+        assert scanner.max_workers == 1
 
     def test_scanner_initialization_with_params(self):
         """Test scanner initialization with custom parameters."""
@@ -32,6 +34,7 @@ class TestFolderScanner:
             exclude_patterns=["*.pyc", "__pycache__"],
             follow_symlinks=True,
             respect_gitignore=False,
+            max_workers=2,
         )
 
         assert scanner.max_depth == 5
@@ -39,6 +42,7 @@ class TestFolderScanner:
         assert scanner.exclude_patterns == ["*.pyc", "__pycache__"]
         assert scanner.follow_symlinks is True
         assert scanner.respect_gitignore is False
+        assert scanner.max_workers == 2
 
     def test_validate_path_success(self, temp_dir):
         """Test path validation with valid directory."""
@@ -108,6 +112,38 @@ class TestFolderScanner:
         assert scanner._should_ignore(Path("data.json")) is False
         assert scanner._should_ignore(Path("readme.txt")) is True
 
+    def test_should_ignore_agrees_with_scan_for_anchored_patterns(
+        self, create_test_structure
+    ):
+        """Test that _should_ignore matches from the scan root like scan()."""
+        root = create_test_structure(
+            {"a.md": "a", "b.md": "b", "docs": {"a.md": "a", "b.md": "b"}}
+        ).resolve()
+        scanner = FolderScanner(exclude_patterns=["docs/*.md", "/a.md"])
+        result = scanner.scan(root)
+
+        assert [f.name for f in result.files] == ["b.md"]
+        assert result.subfolders[0].files == []
+        assert scanner._should_ignore(root / "docs" / "a.md", False) is True
+        assert scanner._should_ignore(root / "a.md", False) is True
+        assert scanner._should_ignore(root / "b.md", False) is False
+
+    def test_include_patterns_match_like_path_match(self):
+        """Test compiled include patterns agree with Path.match()."""
+        patterns = ["*.py", "src/*.json", "/abs/*.txt"]
+        scanner = FolderScanner(include_patterns=patterns)
+
+        for path in [
+            Path("/repo/test.py"),
+            Path("/repo/src/data.json"),
+            Path("/repo/lib/data.json"),
+            Path("/abs/notes.txt"),
+            Path("/repo/abs/notes.txt"),
+            Path("/repo/readme.md"),
+        ]:
+            expected = any(path.match(pattern) for pattern in patterns)
+            assert scanner._matches_include(path) is expected
+
     def test_scan_empty_directory(self, temp_dir):
         """Test scanning an empty directory."""
         scanner = FolderScanner()
@@ -228,6 +264,30 @@ class TestFolderScanner:
         folder_names = {f.name for f in result.subfolders}
         assert "__pycache__" not in folder_names
 
+    def test_scan_never_lists_excluded_folders(
+        self, create_test_structure, monkeypatch
+    ):
+        """Test that excluded folders are pruned before they are listed."""
+        structure = create_test_structure(
+            {
+                "src": {"main.py": "code"},
+                "__pycache__": {"main.pyc": b"cached"},
+            }
+        )
+        listed = []
+        real_scandir = os.scandir
+
+        def recording_scandir(path):
+            listed.append(Path(path).name)
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", recording_scandir)
+        scanner = FolderScanner(exclude_patterns=["__pycache__/"])
+        scanner.scan(structure)
+
+        assert "src" in listed
+        assert "__pycache__" not in listed
+
     def test_scan_with_include_patterns(self, create_test_structure):
         """Test scanning with include patterns."""
         structure = create_test_structure(
@@ -297,6 +357,20 @@ class TestFolderScanner:
         assert scanner.folders_scanned == 2  # root + dir1
         assert isinstance(scanner.errors_encountered, list)
 
+    def test_errors_are_bounded_by_max_errors(self, temp_dir):
+        """Test that only the most recent max_errors messages are kept."""
+        scanner = FolderScanner(max_errors=2)
+        for name in ("a", "b", "c"):
+            scanner._record_walk_error(PermissionError(13, "denied", name))
+
+        assert scanner.errors_encountered == [
+            "Permission denied: b",
+            "Permission denied: c",
+        ]
+
+        scanner.scan(temp_dir)
+        assert scanner.errors_encountered == []
+
     def test_total_size_calculation(self, create_test_structure):
         """Test that total size is calculated correctly."""
         structure = create_test_structure(
@@ -316,6 +390,34 @@ class TestFolderScanner:
         assert result.total_size == 18
         assert result.total_files == 3
 
+    def test_iter_files_yields_all_files(self, create_test_structure):
+        """Test that iter_files streams the same files scan() collects."""
+        structure = create_test_structure(
+            {
+                "file1.txt": "content",
+                "dir1": {
+                    "file2.txt": "content",
+                    "dir2": {
+                        "file3.txt": "content",
+                    },
+                },
+            }
+        )
+
+        scanner = FolderScanner()
+        files = list(scanner.iter_files(structure))
+
+        assert {f.name for f in files} == {"file1.txt", "file2.txt", "file3.txt"}
+        assert scanner.files_scanned == 3
+        assert scanner.folders_scanned == 3
+
+    def test_iter_files_validates_path_eagerly(self, temp_dir):
+        """Test that iter_files rejects invalid paths before iteration."""
+        scanner = FolderScanner()
+
+        with pytest.raises(ValueError, match="does not exist"):
+            scanner.iter_files(temp_dir / "does_not_exist")
+
 
 class TestScannerEdgeCases:
     """Test edge cases and error handling."""
@@ -346,6 +448,25 @@ class TestScannerEdgeCases:
         folder_names = {f.name for f in result.subfolders}
         assert "__pycache__" not in folder_names
 
+    def test_scan_with_anchored_gitignore_patterns(self, create_test_structure):
+        """Test that patterns containing a slash match from the scan root."""
+        structure = create_test_structure(
+            {
+                ".gitignore": "/dist/\ndocs/*.tmp\n",
+                "dist": {"bundle.js": "code"},
+                "docs": {"draft.tmp": "draft", "guide.md": "guide"},
+                "src": {"dist": {"keep.js": "code"}},
+            }
+        )
+
+        scanner = FolderScanner(respect_gitignore=True)
+        result = scanner.scan(structure)
+
+        folders = {f.name: f for f in result.subfolders}
+        assert "dist" not in folders
+        assert [f.name for f in folders["docs"].files] == ["guide.md"]
+        assert [f.name for f in folders["src"].subfolders] == ["dist"]
+
     def test_scan_without_gitignore_respect(self, create_test_structure):
         """Test scanning without respecting .gitignore."""
         structure = create_test_structure(
@@ -363,6 +484,23 @@ class TestScannerEdgeCases:
         file_names = {f.name for f in result.files}
         assert "debug.log" in file_names
 
+    def test_gitignore_does_not_leak_between_scans(self, temp_dir):
+        """Test that ignore files from one scan root don't affect the next."""
+        ignored_root = temp_dir / "ignored"
+        ignored_root.mkdir()
+        (ignored_root / ".gitignore").write_text("*.log\n")
+
+        plain_root = temp_dir / "plain"
+        plain_root.mkdir()
+        (plain_root / "debug.log").write_text("log content")
+
+        scanner = FolderScanner(respect_gitignore=True)
+        scanner.scan(ignored_root)
+        result = scanner.scan(plain_root)
+
+        assert {f.name for f in result.files} == {"debug.log"}
+        assert scanner.exclude_patterns == []
+
     def test_circular_symlink_detection(self, temp_dir):
         """Test detection of circular symlinks."""
         scanner = FolderScanner()
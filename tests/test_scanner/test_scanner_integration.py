@@ -95,6 +95,47 @@ class TestScannerIntegration:
         assert scanner.files_scanned == 100
         assert result.total_files == 100
 
+    def test_parallel_scan_matches_serial_scan(self, create_test_structure):
+        """Test that scanning on a thread pool builds the same tree."""
+        root = create_test_structure(
+            {
+                f"dir{i}": {f"file{j}.txt": f"{i}-{j}" for j in range(5)}
+                | {"nested": {"deep.txt": str(i)}}
+                for i in range(8)
+            }
+        )
+
+        serial = FolderScanner(max_workers=1)
+        parallel = FolderScanner(max_workers=4)
+
+        def shape(node):
+            # Timestamps are left out: reading files may move access times
+            return (
+                node.name,
+                [(f.name, f.size) for f in node.files],
+                [shape(subfolder) for subfolder in node.subfolders],
+            )
+
+        assert shape(parallel.scan(root)) == shape(serial.scan(root))
+        assert parallel.files_scanned == serial.files_scanned == 48
+        assert parallel.folders_scanned == serial.folders_scanned == 17
+
+    def test_scan_without_stats_only_lists_files(self, create_test_structure):
+        """Test that collect_stats=False lists files without their metadata."""
+        root = create_test_structure(
+            {f"file_{i:03d}.txt": f"content {i}" for i in range(100)}
+        )
+
+        scanner = FolderScanner(collect_stats=False)
+        result = scanner.scan(root)
+
+        assert scanner.files_scanned == 100
+        assert result.total_files == 100
+        assert result.total_size == 0
+        assert all(f.mime_type is None for f in result.files)
+        assert {f.extension for f in result.files} == {".txt"}
+        assert result.has_stats is False
+
     def test_scan_mixed_file_types(self, create_test_structure):
         """Test scanning directory with various file types."""
         structure = create_test_structure(
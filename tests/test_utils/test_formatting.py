@@ -2,7 +2,7 @@
 Tests for utility functions.
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
 from folder_profiler.utils.formatting import format_date, format_size
 
@@ -28,6 +28,14 @@ class TestFormatSize:
         """Test formatting gigabytes."""
         assert format_size(1073741824) == "1.00 GB"
 
+    def test_format_unit_boundaries(self):
+        """Test sizes just below and at each unit boundary."""
+        assert format_size(1023) == "1023.00 B"
+        assert format_size(1024**2 - 1) == "1024.00 KB"
+        assert format_size(1024**4) == "1.00 TB"
+        assert format_size(1024**5) == "1.00 PB"
+        assert format_size(1024**6) == "1024.00 PB"
+
     def test_format_zero(self):
         """Test formatting zero bytes."""
         assert format_size(0) == "0.00 B"
@@ -45,3 +53,11 @@ class TestFormatDate:
         """Test formatting ISO date string."""
         iso_str = "2024-01-15T14:30:45"
         assert format_date(iso_str) == "2024-01-15 14:30:45"
+
+    def test_format_aware_datetime_uses_its_own_time_zone(self):
+        """Test aware datetimes format as their local wall-clock time."""
+        utc = datetime(2024, 1, 15, 12, 0, 0, 500, tzinfo=timezone.utc)
+        plus_one = utc.astimezone(timezone(timedelta(hours=1)))
+
+        assert format_date(utc) == "2024-01-15 12:00:00"
+        assert format_date(plus_one) == "2024-01-15 13:00:00"